@@ -9,8 +9,8 @@ bl_info = {
 
 import bpy
 
-from bpy.types import Scene
-from bpy.props import (StringProperty, BoolProperty, CollectionProperty, EnumProperty)
+from bpy.types import Scene, WindowManager
+from bpy.props import (StringProperty, BoolProperty, CollectionProperty, EnumProperty, FloatProperty, PointerProperty)
 from bpy.utils import register_class, unregister_class
 from . import easy_clonex_addon as eca
 
@@ -18,13 +18,28 @@ def register():
     global _icons
     _icons = bpy.utils.previews.new()
     
+    register_class(eca.EasyCloneXPreferences)
     register_class(eca.BaseCloneSelectOperator)
+    register_class(eca.ApplyTraitSelectionOperator)
     register_class(eca.CloneXTraitPropertyGroup)
+    register_class(eca.CloneXGeometryPropertyGroup)
 
     Scene.clonex_trait_collection = CollectionProperty(name='Trait Collection', description='', type=eca.CloneXTraitPropertyGroup)
+    Scene.clonex_geometry = PointerProperty(name='CloneX Geometry', description='Head and suit objects of the loaded clone and their materials', type=eca.CloneXGeometryPropertyGroup)
     Scene.clonex_home_dir = StringProperty(name='CloneX Home Dir', description='', default='', subtype='NONE', maxlen=0)
+    Scene.clonex_base_archive = StringProperty(name='CloneX Base Clone Archive', description='Zip the base clone was extracted from, kept in the extraction cache while the scene uses it', default='')
     Scene.clonex_gender = EnumProperty(name='CloneX Gender', description='', items=[('male', 'Male', ''),('female', 'Female', '')])
     Scene.clonex_loaded = BoolProperty(name='CloneX Loaded', description='', default=False)
+    Scene.clonex_defer_trait_updates = BoolProperty(name='Apply Trait Selection Manually', description='Only equip or hide traits when Apply is pressed, so several checkboxes can be changed with a single load', default=False)
+    Scene.clonex_watch_folder = BoolProperty(name='Watch CloneX Folder', description='Add new trait zips as soon as they are dropped into the CloneX folder', default=False, update=eca.update_watch_folder)
+    Scene.clonex_use_texture_proxies = BoolProperty(name='Viewport Texture Proxies', description='Show downsampled copies of DNA and suit textures in the viewport, renders still use the full resolution ones', default=False, update=eca.update_texture_proxies)
+    WindowManager.clonex_import_stage = StringProperty(name='CloneX Import Stage', description='', default='')
+    WindowManager.clonex_import_progress = FloatProperty(name='CloneX Import Progress', description='', default=0, min=0, max=100, subtype='PERCENTAGE')
+    
+    bpy.app.handlers.load_post.append(eca.clonex_load_post)
+    bpy.app.handlers.render_pre.append(eca.clonex_render_pre)
+    bpy.app.handlers.render_complete.append(eca.clonex_render_done)
+    bpy.app.handlers.render_cancel.append(eca.clonex_render_done)
     
     try: 
         register_class(eca.EasyCloneXPanel)
@@ -35,13 +50,36 @@ def unregister():
     global _icons
     bpy.utils.previews.remove(_icons)
     
+    eca.stop_watching_folder()
+    eca.stop_readahead()
+    eca.stop_texture_proxies()
+    
+    if eca.clonex_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(eca.clonex_load_post)
+    
+    for handlers, handler in ((bpy.app.handlers.render_pre, eca.clonex_render_pre), 
+            (bpy.app.handlers.render_complete, eca.clonex_render_done), 
+            (bpy.app.handlers.render_cancel, eca.clonex_render_done)):
+        if handler in handlers:
+            handlers.remove(handler)
+    
     del Scene.clonex_trait_collection
+    del Scene.clonex_geometry
     del Scene.clonex_home_dir
+    del Scene.clonex_base_archive
     del Scene.clonex_gender
     del Scene.clonex_loaded
+    del Scene.clonex_watch_folder
+    del Scene.clonex_defer_trait_updates
+    del Scene.clonex_use_texture_proxies
+    del WindowManager.clonex_import_stage
+    del WindowManager.clonex_import_progress
     
+    unregister_class(eca.CloneXGeometryPropertyGroup)
     unregister_class(eca.CloneXTraitPropertyGroup)
+    unregister_class(eca.ApplyTraitSelectionOperator)
     unregister_class(eca.BaseCloneSelectOperator)
+    unregister_class(eca.EasyCloneXPreferences)
     
     try: 
         unregister_class(eca.EasyCloneXPanel)
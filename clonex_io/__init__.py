@@ -0,0 +1,2 @@
+# File handling for CloneX downloads that does not depend on bpy, so it can be
+# shared between the add-on, its worker threads and the command line tools
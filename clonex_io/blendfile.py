@@ -0,0 +1,386 @@
+# Reads the block headers and SDNA of a .blend file without Blender, through mmap
+# so only the pages holding the headers and the fields asked for are touched
+import re, gzip, mmap, struct, zipfile
+
+# Object.type values from DNA_object_types.h
+OBJECT_TYPES = {
+    0: 'EMPTY', 1: 'MESH', 2: 'CURVE', 3: 'SURFACE', 4: 'FONT', 5: 'META',
+    10: 'LIGHT', 11: 'CAMERA', 12: 'SPEAKER', 13: 'LIGHT_PROBE', 22: 'LATTICE',
+    25: 'ARMATURE', 26: 'GPENCIL', 27: 'CURVES', 28: 'POINTCLOUD', 29: 'VOLUME',
+}
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+class BlendFileError(Exception):
+    pass
+
+class BlockHeader:
+    __slots__ = ('code', 'size', 'old_address', 'sdna_index', 'count', 'offset')
+    
+    def __init__(self, code, size, old_address, sdna_index, count, offset):
+        self.code = code
+        self.size = size
+        self.old_address = old_address
+        self.sdna_index = sdna_index
+        self.count = count
+        # Where the block's data starts in the file
+        self.offset = offset
+
+class StructField:
+    __slots__ = ('name', 'type', 'offset', 'size', 'is_pointer', 'array_size')
+    
+    def __init__(self, name, type, offset, size, is_pointer, array_size):
+        self.name = name
+        self.type = type
+        self.offset = offset
+        self.size = size
+        self.is_pointer = is_pointer
+        self.array_size = array_size
+
+class StructDNA:
+    __slots__ = ('type', 'size', 'fields')
+    
+    def __init__(self, type, size, fields):
+        self.type = type
+        self.size = size
+        # Field name without '*' or array brackets -> StructField
+        self.fields = fields
+
+def _read_c_string(buf, offset, size=None):
+    end = buf.find(b'\0', offset, offset + size if size is not None else len(buf))
+    
+    if end < 0:
+        end = offset + size if size is not None else len(buf)
+    
+    return bytes(buf[offset:end]).decode('utf-8', 'replace')
+
+def _align4(offset, base=0):
+    # SDNA sections are aligned relative to the start of the block, not the file
+    return base + ((offset - base + 3) & ~3)
+
+class BlendFile:
+    """A .blend file opened for reading
+    
+    offset and size read a .blend stored uncompressed inside a bigger file (like a 
+    zip member) in place, data reads one that is already in memory. Gzip compressed 
+    files are decompressed into memory, zstd ones (the 3.0+ default when compression 
+    is on) only when the zstandard module is installed
+    """
+    
+    def __init__(self, path, offset=0, size=None, data=None):
+        self.path = path
+        self._file = open(path, 'rb') if data is None else None
+        
+        try:
+            self.buf, self.start, self.end = self._map(offset, size, data)
+            self._read_header()
+            self.blocks = self._read_blocks()
+            self.structs = self._read_sdna()
+        except (struct.error, ValueError, IndexError) as e:
+            self.close()
+            raise BlendFileError('{} is not a readable .blend file: {}'.format(path, e))
+        except BaseException:
+            self.close()
+            raise
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def close(self):
+        if isinstance(getattr(self, 'buf', None), mmap.mmap):
+            self.buf.close()
+        
+        if self._file is not None:
+            self._file.close()
+    
+    def _decompress(self, data):
+        if data[:2] == GZIP_MAGIC:
+            return gzip.decompress(data)
+        
+        if data[:4] == ZSTD_MAGIC:
+            try:
+                import zstandard
+            except ImportError:
+                raise BlendFileError(self.path + ' is zstd compressed and the zstandard module is not installed')
+            
+            # Blender writes many independent frames (plus a seek table), a decompressobj stops after one
+            decompressor = zstandard.ZstdDecompressor()
+            chunks = []
+            
+            while len(data) > 0:
+                frame = decompressor.decompressobj()
+                chunks.append(frame.decompress(data))
+                data = frame.unused_data
+            
+            return b''.join(chunks)
+        
+        return data
+    
+    def _map(self, offset, size, data):
+        if data is not None:
+            data = self._decompress(data)
+            
+            return data, 0, len(data)
+        
+        buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        end = len(buf) if size is None else offset + size
+        
+        if buf[offset:offset + 2] == GZIP_MAGIC or buf[offset:offset + 4] == ZSTD_MAGIC:
+            data = self._decompress(buf[offset:end])
+            buf.close()
+            
+            return data, 0, len(data)
+        
+        return buf, offset, end
+    
+    def _read_header(self):
+        buf = self.buf
+        start = self.start
+        
+        if bytes(buf[start:start + 7]) != b'BLENDER':
+            raise BlendFileError(self.path + ' is not a .blend file')
+        
+        if buf[start + 7:start + 9].isdigit():
+            # 'BLENDER17-01v0500': header size, file format version and Blender version (5.0+)
+            header_size = int(bytes(buf[start + 7:start + 9]))
+            self.pointer_size = 8
+            self.endian = '<'
+            self.version = int(bytes(buf[start + header_size - 4:start + header_size]))
+            self.large_bhead = True
+            self.header_size = header_size
+        else:
+            # 'BLENDER-v302': pointer size, endianness and version
+            self.pointer_size = 8 if buf[start + 7:start + 8] == b'-' else 4
+            self.endian = '<' if buf[start + 8:start + 9] == b'v' else '>'
+            self.version = int(bytes(buf[start + 9:start + 12]))
+            self.large_bhead = False
+            self.header_size = 12
+        
+        self.pointer_format = self.endian + ('Q' if self.pointer_size == 8 else 'I')
+    
+    def _read_blocks(self):
+        buf = self.buf
+        offset = self.start + self.header_size
+        blocks = []
+        
+        if self.large_bhead:
+            fmt = self.endian + '4siQqq'
+        else:
+            fmt = self.endian + '4si' + ('Q' if self.pointer_size == 8 else 'I') + 'ii'
+        
+        bhead_size = struct.calcsize(fmt)
+        
+        while offset + bhead_size <= self.end:
+            if self.large_bhead:
+                code, sdna_index, old_address, size, count = struct.unpack_from(fmt, buf, offset)
+            else:
+                code, size, old_address, sdna_index, count = struct.unpack_from(fmt, buf, offset)
+            
+            offset += bhead_size
+            
+            if code == b'ENDB':
+                break
+            
+            blocks.append(BlockHeader(code.rstrip(b'\0'), size, old_address, sdna_index, count, offset))
+            offset += size
+        
+        return blocks
+    
+    def _read_sdna(self):
+        dna = [b for b in self.blocks if b.code == b'DNA1']
+        
+        if len(dna) == 0:
+            raise BlendFileError(self.path + ' has no SDNA block')
+        
+        buf = self.buf
+        e = self.endian
+        offset = dna[0].offset
+        
+        if bytes(buf[offset:offset + 8]) != b'SDNANAME':
+            raise BlendFileError(self.path + ' has an unreadable SDNA block')
+        
+        def read_strings(offset):
+            count, = struct.unpack_from(e + 'i', buf, offset)
+            offset += 4
+            strings = []
+            
+            for _ in range(count):
+                end = buf.find(b'\0', offset, self.end)
+                
+                if end < 0:
+                    raise BlendFileError(self.path + ' has a truncated SDNA block')
+                
+                strings.append(bytes(buf[offset:end]).decode('ascii', 'replace'))
+                offset = end + 1
+            
+            return strings, _align4(offset, dna[0].offset)
+        
+        names, offset = read_strings(offset + 8)
+        types, offset = read_strings(offset + 4)
+        
+        # TLEN: the size of every type
+        offset += 4
+        type_sizes = struct.unpack_from(e + str(len(types)) + 'h', buf, offset)
+        offset = _align4(offset + 2 * len(types), dna[0].offset)
+        
+        # STRC: (type, field count) then (type, name) per field
+        offset += 4
+        struct_count, = struct.unpack_from(e + 'i', buf, offset)
+        offset += 4
+        structs = {}
+        self.struct_list = []
+        
+        for _ in range(struct_count):
+            type_index, field_count = struct.unpack_from(e + 'hh', buf, offset)
+            offset += 4
+            pairs = struct.unpack_from(e + str(2 * field_count) + 'h', buf, offset)
+            offset += 4 * field_count
+            
+            fields = {}
+            field_offset = 0
+            
+            for field_type, field_name in zip(pairs[0::2], pairs[1::2]):
+                name = names[field_name]
+                is_pointer = name.startswith('*') or name.startswith('(*')
+                array_size = 1
+                
+                for dim in re.findall(r'\[(\d+)\]', name):
+                    array_size *= int(dim)
+                
+                size = (self.pointer_size if is_pointer else type_sizes[field_type]) * array_size
+                key = re.sub(r'[\*\(\)]|\[.*', '', name)
+                fields[key] = StructField(key, types[field_type], field_offset, size, is_pointer, array_size)
+                field_offset += size
+            
+            struct_dna = StructDNA(types[type_index], type_sizes[type_index], fields)
+            structs[struct_dna.type] = struct_dna
+            self.struct_list.append(struct_dna)
+        
+        return structs
+    
+    def find_blocks(self, code):
+        return [b for b in self.blocks if b.code == code]
+    
+    def field(self, struct_type, path):
+        """Offset and StructField of a dotted field path like 'id.name' inside a struct"""
+        offset = 0
+        field = None
+        
+        for name in path.split('.'):
+            struct_dna = self.structs.get(struct_type if field is None else field.type)
+            
+            if struct_dna is None or name not in struct_dna.fields:
+                return None, None
+            
+            field = struct_dna.fields[name]
+            offset += field.offset
+        
+        return offset, field
+    
+    def has_field(self, struct_type, path):
+        return self.field(struct_type, path)[1] is not None
+    
+    def read(self, block, struct_type, path, index=0):
+        """Read one field of the index-th struct in a block, None when the field doesn't exist"""
+        offset, field = self.field(struct_type, path)
+        
+        if field is None:
+            return None
+        
+        offset += block.offset + index * self.structs[struct_type].size
+        
+        if field.is_pointer:
+            return struct.unpack_from(self.pointer_format, self.buf, offset)[0]
+        
+        if field.type == 'char':
+            return _read_c_string(self.buf, offset, field.size)
+        
+        fmt = {'short': 'h', 'ushort': 'H', 'int': 'i', 'uint': 'I', 'float': 'f', 'double': 'd',
+               'int64_t': 'q', 'uint64_t': 'Q', 'int8_t': 'b', 'uchar': 'B'}.get(field.type)
+        
+        if fmt is None:
+            return None
+        
+        return struct.unpack_from(self.endian + fmt, self.buf, offset)[0]
+    
+    def read_first(self, block, struct_type, paths, index=0):
+        # Field names change between Blender versions, e.g. Mesh.totvert became verts_num
+        for path in paths:
+            if self.has_field(struct_type, path):
+                return self.read(block, struct_type, path, index)
+        
+        return None
+    
+    def block_struct(self, block):
+        return self.struct_list[block.sdna_index].type if 0 <= block.sdna_index < len(self.struct_list) else None
+    
+    def id_name(self, block):
+        # ID names start with the two letter ID code, e.g. 'OBHeadGeo'
+        name = self.read(block, self.block_struct(block), 'id.name')
+        
+        return name[2:] if name is not None else None
+
+def read_object_types(path):
+    """Object name -> type ('MESH', 'ARMATURE', ...) for every object in a .blend file"""
+    with BlendFile(path) as blend:
+        return {blend.id_name(block): OBJECT_TYPES.get(blend.read(block, 'Object', 'type'), 'UNKNOWN') for block in blend.find_blocks(b'OB')}
+
+def open_zip_member(archive_path, name):
+    """Open a .blend inside a zip, stored members are mapped in place and compressed ones inflated into memory"""
+    with zipfile.ZipFile(archive_path) as zip_ref:
+        info = zip_ref.getinfo(name)
+        
+        if info.compress_type != zipfile.ZIP_STORED:
+            return BlendFile(archive_path + '/' + name, data=zip_ref.read(name))
+    
+    # The member's data starts after its local header, whose name and extra field can 
+    # differ from the central directory's
+    with open(archive_path, 'rb') as f:
+        f.seek(info.header_offset)
+        local_header = f.read(30)
+    
+    name_size, extra_size = struct.unpack('<HH', local_header[26:30])
+    
+    return BlendFile(archive_path, info.header_offset + 30 + name_size + extra_size, info.file_size)
+
+def read_contents(blend):
+    """Objects, meshes, materials and images in an open BlendFile, as plain dicts"""
+    names = {}
+    
+    # Pointers in the file are the addresses the blocks had when it was saved
+    for block in blend.blocks:
+        if block.code in (b'OB', b'ME', b'MA', b'IM', b'AR'):
+            names[block.old_address] = blend.id_name(block)
+    
+    objects = []
+    
+    for block in blend.find_blocks(b'OB'):
+        objects.append({
+            'name': blend.id_name(block),
+            'type': OBJECT_TYPES.get(blend.read(block, 'Object', 'type'), 'UNKNOWN'),
+            'data': names.get(blend.read(block, 'Object', 'data')),
+            'parent': names.get(blend.read(block, 'Object', 'parent')),
+        })
+    
+    meshes = [{
+        'name': blend.id_name(block),
+        'vertices': blend.read_first(block, 'Mesh', ['verts_num', 'totvert']),
+        'polygons': blend.read_first(block, 'Mesh', ['faces_num', 'totpoly']),
+    } for block in blend.find_blocks(b'ME')]
+    
+    images = [{
+        'name': blend.id_name(block),
+        'filepath': blend.read_first(block, 'Image', ['filepath', 'name']),
+    } for block in blend.find_blocks(b'IM')]
+    
+    return {
+        'version': blend.version,
+        'objects': objects,
+        'meshes': meshes,
+        'materials': [blend.id_name(block) for block in blend.find_blocks(b'MA')],
+        'images': images,
+    }
@@ -0,0 +1,227 @@
+import os, json, time, shutil, hashlib, zipfile, tempfile, threading
+from . import extract
+
+INDEX_NAME = 'cache_index.json'
+
+def directory_size(path):
+    total = 0
+    
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    
+    return total
+
+def archive_content_key(archive_path):
+    # The archive size plus every member's name, size and CRC identifies the contents, 
+    # so the same download copied into several project folders shares one entry
+    h = hashlib.sha1(str(os.path.getsize(archive_path)).encode())
+    
+    with zipfile.ZipFile(archive_path) as zip_ref:
+        for info in sorted(zip_ref.infolist(), key=lambda i: i.filename):
+            h.update('{}\0{}\0{}\n'.format(info.filename, info.file_size, info.CRC).encode())
+    
+    return h.hexdigest()
+
+class ExtractionCache:
+    """User level store of extracted CloneX archives that every project can reuse
+    
+    Entries live in root/<key> and are evicted least recently used first once 
+    the cache grows past max_bytes. The folder watcher and imports use it from 
+    their own threads, so the index is only touched while holding the lock
+    """
+    
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
+        self.index = self._read_index()
+    
+    def _read_index(self):
+        try:
+            with open(os.path.join(self.root, INDEX_NAME)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        
+        index.setdefault('archives', {})
+        index.setdefault('entries', {})
+        
+        return index
+    
+    def _write_index(self):
+        os.makedirs(self.root, exist_ok=True)
+        
+        # Every write gets its own temp file, other Blender sessions may share the cache
+        fd, tmp_path = tempfile.mkstemp(prefix=INDEX_NAME, suffix='.tmp', dir=self.root)
+        
+        try:
+            with self.lock, os.fdopen(fd, 'w') as f:
+                json.dump(self.index, f)
+            
+            os.replace(tmp_path, os.path.join(self.root, INDEX_NAME))
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            
+            raise
+    
+    def archive_key(self, archive_path):
+        # Size and mtime decide whether the central directory has to be read again
+        st = os.stat(archive_path)
+        stamp = [st.st_size, st.st_mtime_ns]
+        
+        with self.lock:
+            known = self.index['archives'].get(archive_path)
+        
+        if known is not None and known[:2] == stamp:
+            return known[2]
+        
+        key = archive_content_key(archive_path)
+        
+        with self.lock:
+            self.index['archives'][archive_path] = stamp + [key]
+        
+        return key
+    
+    def entry_dir(self, archive_path):
+        return os.path.join(self.root, self.archive_key(archive_path))
+    
+    def extract(self, archive_paths, gender=None, max_workers=None, keep=(), progress=None):
+        """Make sure every archive has a verified entry and return {archive_path: entry_dir}
+        
+        Entries for the archives in keep are never evicted, the scene may still reference their files
+        """
+        entries = {path: self.entry_dir(path) for path in archive_paths}
+        
+        # Entries are verified against their manifest, so a half finished extraction 
+        # is resumed instead of being mistaken for a complete one
+        extract.extract_archives(list(entries.items()), gender, max_workers, progress)
+        
+        now = time.time()
+        sizes = {os.path.basename(entry): directory_size(entry) for entry in entries.values()}
+        
+        keep_keys = set(sizes)
+        keep_keys.update(self.archive_key(path) for path in keep if os.path.isfile(path))
+        
+        with self.lock:
+            for key, size in sizes.items():
+                self.index['entries'].setdefault(key, {}).update(last_used=now, bytes=size)
+            
+            self.evict(keep_keys)
+            self._write_index()
+        
+        return entries
+    
+    def pin(self, archive_paths):
+        """Never evict these archives' entries, linked .blend files keep reading from them"""
+        keys = [self.archive_key(path) for path in archive_paths]
+        
+        with self.lock:
+            for key in keys:
+                entry = self.index['entries'].get(key)
+                
+                if entry is not None:
+                    entry['pinned'] = True
+            
+            self._write_index()
+    
+    def total_bytes(self):
+        with self.lock:
+            return sum(e['bytes'] for e in self.index['entries'].values())
+    
+    def evict(self, keep=()):
+        with self.lock:
+            total = self.total_bytes()
+            
+            for key, entry in sorted(self.index['entries'].items(), key=lambda kv: kv[1]['last_used']):
+                if total <= self.max_bytes:
+                    break
+                
+                if key in keep or entry.get('pinned', False):
+                    continue
+                
+                shutil.rmtree(os.path.join(self.root, key), ignore_errors=True)
+                del self.index['entries'][key]
+                total -= entry['bytes']
+            
+            # Forget archives that were deleted. Stamps of zips that were never extracted are 
+            # kept, they save reading the central directory again when the folder is reopened
+            self.index['archives'] = {
+                path: stamp for path, stamp in self.index['archives'].items() if os.path.isfile(path)
+            }
+
+def snapshot_key(gender, sources, selected, extra=()):
+    """Key for an assembled clone: the gender, every source's stamp and the selected traits
+    
+    sources is [(folder_name, stamp)], so the key changes as soon as any archive or folder 
+    the clone was built from does
+    """
+    data = [gender, sorted([name, stamp] for name, stamp in sources), sorted(selected), list(extra)]
+    
+    return hashlib.sha1(json.dumps(data).encode()).hexdigest()
+
+class SnapshotCache:
+    """Assembled clones saved as .blend files in root/<key>.blend
+    
+    The file mtime doubles as the last use time, the least recently used snapshots 
+    are removed once the folder grows past max_bytes
+    """
+    
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+    
+    def path(self, key):
+        return os.path.join(self.root, key + '.blend')
+    
+    def get(self, key):
+        path = self.path(key)
+        
+        if not os.path.isfile(path):
+            return None
+        
+        os.utime(path)
+        
+        return path
+    
+    def temp_path(self, key):
+        # Written here first, then moved into place by commit so a crash never leaves half a snapshot
+        os.makedirs(self.root, exist_ok=True)
+        
+        return self.path(key) + '.tmp'
+    
+    def commit(self, key):
+        os.replace(self.path(key) + '.tmp', self.path(key))
+        self.evict(keep=(key,))
+    
+    def discard(self, key):
+        for path in (self.path(key), self.path(key) + '.tmp'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def evict(self, keep=()):
+        try:
+            entries = [e for e in os.scandir(self.root) if e.name.endswith('.blend')]
+        except OSError:
+            return
+        
+        snapshots = sorted(((e.stat().st_mtime, e.stat().st_size, e.name[:-len('.blend')]) for e in entries))
+        total = sum(size for mtime, size, key in snapshots)
+        
+        for mtime, size, key in snapshots:
+            if total <= self.max_bytes:
+                break
+            
+            if key in keep:
+                continue
+            
+            self.discard(key)
+            total -= size
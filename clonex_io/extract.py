@@ -0,0 +1,311 @@
+import os, json, time, zlib, zipfile, threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Large archives are split into member ranges of roughly this many compressed
+# bytes so a single multi-GB trait zip is still spread across several workers
+MEMBER_RANGE_BYTES = 64 * 1024 * 1024
+
+# Written into every extraction directory to record each completed member
+MANIFEST_NAME = '.easy_clonex_manifest.json'
+
+class ExtractionCancelled(Exception):
+    pass
+
+class ExtractionProgress:
+    """Shared between the extraction workers and whoever is waiting on them"""
+    
+    def __init__(self):
+        self.total = 0
+        self.done = 0
+        self.lock = threading.Lock()
+        self.cancel_event = threading.Event()
+    
+    def add_total(self, count):
+        with self.lock:
+            self.total += count
+    
+    def advance(self):
+        with self.lock:
+            self.done += 1
+    
+    def cancel(self):
+        self.cancel_event.set()
+    
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+    
+    def fraction(self):
+        return self.done / self.total if self.total > 0 else 0.0
+
+def default_worker_count():
+    return max(1, min(8, os.cpu_count() or 1))
+
+def member_target_path(dest_dir, member):
+    # Mirrors the path sanitising done by ZipFile.extract
+    parts = [p for p in member.filename.replace('\\', '/').split('/') if p not in ('', '.', '..')]
+    
+    return os.path.normpath(os.path.join(dest_dir, *parts))
+
+def split_member_ranges(members, range_bytes=MEMBER_RANGE_BYTES):
+    ranges = []
+    current = []
+    current_bytes = 0
+    
+    for member in members:
+        current.append(member)
+        current_bytes += member.compress_size
+        
+        if current_bytes >= range_bytes:
+            ranges.append(current)
+            current = []
+            current_bytes = 0
+    
+    if len(current) > 0:
+        ranges.append(current)
+    
+    return ranges
+
+def _create_member_dirs(dest_dir, members):
+    # Create every directory up front so workers never race on makedirs
+    dirs = {dest_dir}
+    
+    for member in members:
+        target = member_target_path(dest_dir, member)
+        dirs.add(target if member.is_dir() else os.path.dirname(target))
+    
+    for path in sorted(dirs):
+        os.makedirs(path, exist_ok=True)
+
+def is_member_needed(name, gender):
+    parts = [p for p in name.replace('\\', '/').split('/') if p != '']
+    
+    if len(parts) < 2:
+        return len(parts) == 1 and parts[0] == '_texture'
+    
+    if parts[0] == '_' + gender:
+        # The .blend files plus any textures they reference relative to themselves
+        return parts[1] in ('_blender', '_textures')
+    elif parts[0] == '_textures':
+        return parts[1] == 'suit_' + gender
+    elif parts[0] == '_texture':
+        return True
+    
+    return False
+
+def read_manifest(dest_dir):
+    try:
+        with open(os.path.join(dest_dir, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    # Manifests from before members were tracked individually can't be verified
+    if 'members' not in manifest:
+        return None
+    
+    return manifest
+
+def write_manifest(dest_dir, manifest):
+    path = os.path.join(dest_dir, MANIFEST_NAME)
+    
+    with open(path + '.tmp', 'w') as f:
+        json.dump(manifest, f)
+    
+    os.replace(path + '.tmp', path)
+
+def file_crc(path):
+    crc = 0
+    
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            crc = zlib.crc32(chunk, crc)
+    
+    return crc
+
+def manifest_entry(member, st):
+    # The mtime is what tells a file rewritten in place at the same size apart from the one we wrote
+    return [member.file_size, member.CRC, st.st_mtime_ns]
+
+def verify_member(dest_dir, member, recorded, check_crc):
+    """Check an extracted member against the central directory and what the manifest recorded
+    
+    Returns the member's manifest entry when it checks out, otherwise None
+    """
+    path = member_target_path(dest_dir, member)
+    
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    
+    if st.st_size != member.file_size:
+        return None
+    
+    if recorded is not None and list(recorded[:2]) != [member.file_size, member.CRC]:
+        return None
+    
+    entry = manifest_entry(member, st)
+    
+    # Files the manifest never saw complete, or that changed since it recorded them, have to prove themselves
+    if recorded is None or check_crc or list(recorded) != entry:
+        if file_crc(path) != member.CRC:
+            return None
+    
+    return entry
+
+class ManifestWriter:
+    """Records members as workers finish them and flushes every few seconds,
+    so a crash only loses the members written since the last flush
+    """
+    
+    FLUSH_INTERVAL = 2.0
+    
+    def __init__(self, dest_dir, manifest):
+        self.dest_dir = dest_dir
+        self.manifest = manifest
+        self.lock = threading.Lock()
+        self.last_flush = time.monotonic()
+    
+    def flush(self):
+        write_manifest(self.dest_dir, self.manifest)
+        self.last_flush = time.monotonic()
+    
+    def add(self, member):
+        entry = manifest_entry(member, os.stat(member_target_path(self.dest_dir, member)))
+        
+        with self.lock:
+            self.manifest['members'][member.filename] = entry
+            
+            if time.monotonic() - self.last_flush > self.FLUSH_INTERVAL:
+                self.flush()
+    
+    def finish(self, members):
+        with self.lock:
+            # Whatever is left in the archive is what we skipped
+            done = self.manifest['members']
+            self.manifest['skipped'] = sorted(m.filename for m in members if not m.is_dir() and m.filename not in done)
+            self.manifest['complete'] = True
+            self.flush()
+
+def _extract_member_range(archive_path, dest_dir, names, writer, progress):
+    # Every worker gets its own handle so reads don't serialise on a shared file lock
+    with zipfile.ZipFile(archive_path) as zip_ref:
+        for name in names:
+            if progress.is_cancelled():
+                raise ExtractionCancelled()
+            
+            zip_ref.extract(name, dest_dir)
+            
+            # Only recorded once the file has been closed
+            writer.add(zip_ref.getinfo(name))
+            progress.advance()
+    
+    return len(names)
+
+def plan_extraction(members, dest_dir, gender=None, pool=None):
+    """Split the archive members into the ones to extract now and the ones already on disk
+    
+    Members recorded in the manifest are checked by size and mtime, plus their CRC when 
+    either differs from the manifest or the last extraction never finished. Files without a manifest entry (left by a crash or an older 
+    version of the add-on) are adopted when their CRC matches.
+    """
+    manifest = read_manifest(dest_dir) or {'members': {}, 'complete': False}
+    recorded = manifest['members']
+    check_crc = not manifest.get('complete', False)
+    
+    candidates = [m for m in members if not m.is_dir() and (gender is None or is_member_needed(m.filename, gender))]
+    
+    if os.path.isdir(dest_dir):
+        def check(member):
+            return verify_member(dest_dir, member, recorded.get(member.filename), check_crc)
+        
+        verified = list(pool.map(check, candidates) if pool is not None else map(check, candidates))
+    else:
+        verified = [None] * len(candidates)
+    
+    wanted = [m for m, entry in zip(candidates, verified) if entry is None]
+    manifest['members'] = {m.filename: entry for m, entry in zip(candidates, verified) if entry is not None}
+    
+    # Keep what was verified earlier for the other gender
+    candidate_names = {m.filename for m in candidates}
+    
+    for name, entry in recorded.items():
+        if name not in candidate_names:
+            manifest['members'][name] = entry
+    
+    # Nothing gets extracted, but files that passed their CRC check with a new mtime 
+    # are recorded so they aren't read in full again next time
+    if len(wanted) == 0 and manifest.get('complete', False) and manifest['members'] != recorded:
+        write_manifest(dest_dir, manifest)
+    
+    return wanted, manifest
+
+def plan_extraction_jobs(archives, gender=None, pool=None, progress=None, range_bytes=MEMBER_RANGE_BYTES):
+    jobs = []
+    writers = []
+    
+    for archive_path, dest_dir in archives:
+        if progress is not None and progress.is_cancelled():
+            raise ExtractionCancelled()
+        
+        with zipfile.ZipFile(archive_path) as zip_ref:
+            members = zip_ref.infolist()
+        
+        wanted, manifest = plan_extraction(members, dest_dir, gender, pool)
+        
+        if len(wanted) == 0 and manifest.get('complete', False):
+            continue
+        
+        _create_member_dirs(dest_dir, wanted)
+        
+        # Mark the extraction as in progress before anything is written
+        manifest['archive'] = os.path.basename(archive_path)
+        manifest['complete'] = False
+        writer = ManifestWriter(dest_dir, manifest)
+        writer.flush()
+        writers.append((writer, members))
+        
+        for member_range in split_member_ranges(wanted, range_bytes):
+            jobs.append((archive_path, dest_dir, [m.filename for m in member_range], writer))
+        
+        if progress is not None:
+            progress.add_total(len(wanted))
+    
+    return jobs, writers
+
+def extract_archives(archives, gender=None, max_workers=None, progress=None):
+    """Extract (archive_path, dest_dir) pairs across a thread pool and wait for all of them
+    
+    When a gender is given only the members the add-on reads for it are written. Every 
+    directory gets a manifest of the members that were completed (size plus CRC), so a rerun 
+    after a crash or a cancel only extracts what is missing or corrupt, and switching gender 
+    later only extracts the missing half. Cancelling the progress object raises ExtractionCancelled.
+    """
+    if max_workers is None or max_workers < 1:
+        max_workers = default_worker_count()
+    
+    if progress is None:
+        progress = ExtractionProgress()
+    
+    writers = []
+    
+    # zlib, crc32 and file I/O release the GIL, so threads scale without having to
+    # spawn extra Blender processes
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            jobs, writers = plan_extraction_jobs(archives, gender, pool, progress)
+            futures = [pool.submit(_extract_member_range, *job, progress) for job in jobs]
+            
+            # result() re-raises the first failure from a worker
+            extracted = sum(future.result() for future in futures)
+    except BaseException:
+        # Keep whatever was completed so the next run can resume from it
+        for writer, members in writers:
+            with writer.lock:
+                writer.flush()
+        raise
+    
+    for writer, members in writers:
+        writer.finish(members)
+    
+    return extracted
@@ -0,0 +1,314 @@
+import os, json, zipfile
+
+GENDERS = ('male', 'female')
+
+# Sidecar written into the CloneX folder so reopening it doesn't walk the tree again
+INDEX_CACHE_NAME = '.easy_clonex_index.json'
+INDEX_CACHE_VERSION = 2
+
+# Compared lower case, downloads have been seen with .PNG files
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg')
+
+# Last '_' separated token of a texture file name and the material input it drives
+TEXTURE_CHANNELS = ('d', 'm', 'r', 'e', 'n')
+
+def format_trait_display_name(folder_name):
+    folder_name_tokenized = folder_name.split('-')
+    trait_name = ''
+    
+    for idx, token in enumerate(folder_name_tokenized):
+        if idx == 0:
+            trait_name += token + ' -'
+            continue
+        
+        if (token != 'Combined'):
+            trait_description_tokens = token.split('_')
+            
+            for desc_token in trait_description_tokens:
+                trait_name += ' ' + desc_token.capitalize()
+
+    return trait_name 
+
+def is_base_clone(folder_name):
+    return folder_name.startswith('Characters-character')
+
+def is_trait_folder(folder_name):
+    # Don't create a checkbox for the base clone file
+    return 'Characters-character' not in folder_name and folder_name.endswith('Combined')
+
+class TraitRecord:
+    """Everything the add-on needs to know about one CloneX folder or zip"""
+    
+    __slots__ = ('folder_name', 'trait_dir', 'archive', 'display_name', 'genders', 'blend_files', 'texture_dirs', 'texture_files', 'stamp')
+    
+    def __init__(self, folder_name, trait_dir, archive=''):
+        self.folder_name = folder_name
+        self.trait_dir = trait_dir
+        self.archive = archive
+        self.display_name = format_trait_display_name(folder_name)
+        self.genders = ()
+        # gender -> .blend file, only for traits with meshes
+        self.blend_files = {}
+        # gender -> texture folder, only for the suit (Characters) and DNA texture traits
+        self.texture_dirs = {}
+        # gender -> [(image file, channel suffix)] found under the texture folder
+        self.texture_files = {}
+        # What the record was built from, see _stamp_is_current
+        self.stamp = []
+    
+    def has_gender(self, gender):
+        return gender in self.blend_files or gender in self.texture_dirs
+
+def texture_channel(filename):
+    tokens = os.path.splitext(filename)[0].split('_')
+    
+    return tokens[len(tokens)-1].lower()
+
+def classify_texture(filename):
+    """Channel of a texture file from its suffix (_d, _m, _r, _e or _n), None for any other file"""
+    if os.path.splitext(filename)[1].lower() not in IMAGE_EXTS:
+        return None
+    
+    channel = texture_channel(filename)
+    
+    return channel if channel in TEXTURE_CHANNELS else None
+
+def _add_paths(record, paths):
+    # paths are '/' separated and relative to the trait folder, either zip member
+    # names or the result of walking an extracted folder
+    genders = set()
+    texture_paths = []
+    
+    for path in paths:
+        parts = [p for p in path.split('/') if p != '']
+        
+        if len(parts) == 0:
+            continue
+        
+        if parts[0] in ('_male', '_female'):
+            gender = parts[0][1:]
+            genders.add(gender)
+            
+            if len(parts) == 3 and parts[1] == '_blender' and parts[2].endswith('.blend'):
+                blend_file = os.path.join(record.trait_dir, *parts)
+                
+                # Stick with the first file by name so the choice doesn't depend on listing order
+                if gender not in record.blend_files or blend_file < record.blend_files[gender]:
+                    record.blend_files[gender] = blend_file
+        elif parts[0] == '_textures' and len(parts) >= 2 and parts[1].startswith('suit_'):
+            gender = parts[1][len('suit_'):]
+            
+            if gender in GENDERS:
+                record.texture_dirs[gender] = os.path.join(record.trait_dir, '_textures', parts[1])
+                
+                # Only the files straight inside the texture folder
+                if len(parts) == 3:
+                    texture_paths.append(([gender], parts))
+        elif parts[0] == '_texture':
+            # DNA textures are shared by both genders
+            for gender in GENDERS:
+                record.texture_dirs[gender] = os.path.join(record.trait_dir, '_texture')
+            
+            if len(parts) == 2:
+                texture_paths.append((GENDERS, parts))
+    
+    for texture_genders, parts in sorted(texture_paths, key=lambda t: t[1]):
+        channel = classify_texture(parts[-1])
+        
+        if channel is None:
+            continue
+        
+        texture_file = os.path.join(record.trait_dir, *parts)
+        
+        for gender in texture_genders:
+            record.texture_files.setdefault(gender, []).append((texture_file, channel))
+    
+    record.genders = tuple(g for g in GENDERS if g in genders or g in record.texture_dirs)
+
+def _list_texture_dir(path, prefix, scanned):
+    # Texture sets sit straight inside their folder, one scandir is enough
+    scanned.append(prefix.rstrip('/'))
+    
+    with os.scandir(path) as entries:
+        return [prefix] + [prefix + e.name for e in entries if e.is_file()]
+
+def _scan_folder_paths(trait_dir):
+    # Only descends into the handful of folders the add-on reads, and returns those 
+    # folders as well so the cached record can be checked against their mtimes
+    paths = []
+    scanned = ['']
+    
+    with os.scandir(trait_dir) as top_entries:
+        for top in top_entries:
+            if not top.is_dir():
+                continue
+            
+            if top.name in ('_male', '_female'):
+                paths.append(top.name)
+                blender_dir = os.path.join(top.path, '_blender')
+                
+                if os.path.isdir(blender_dir):
+                    scanned.append(top.name + '/_blender')
+                    
+                    with os.scandir(blender_dir) as entries:
+                        paths.extend(top.name + '/_blender/' + e.name for e in entries if e.is_file())
+            elif top.name == '_textures':
+                scanned.append('_textures')
+                
+                with os.scandir(top.path) as entries:
+                    for e in entries:
+                        if e.is_dir() and e.name.startswith('suit_'):
+                            paths.extend(_list_texture_dir(e.path, '_textures/' + e.name + '/', scanned))
+            elif top.name == '_texture':
+                paths.extend(_list_texture_dir(top.path, '_texture/', scanned))
+    
+    return paths, scanned
+
+def _folder_stamp(trait_dir, scanned):
+    stamp = []
+    
+    for rel in scanned:
+        try:
+            stamp.append([rel, os.stat(os.path.join(trait_dir, rel)).st_mtime_ns])
+        except OSError:
+            stamp.append([rel, None])
+    
+    return stamp
+
+def _archive_stamp(archive):
+    st = os.stat(archive)
+    
+    return [st.st_size, st.st_mtime_ns]
+
+def read_trait_record(folder_name, trait_dir, archive=''):
+    record = TraitRecord(folder_name, trait_dir, archive)
+    
+    if archive != '':
+        # Zipped traits are indexed straight from the central directory, whether or not 
+        # they have been extracted yet
+        with zipfile.ZipFile(archive) as zip_ref:
+            _add_paths(record, zip_ref.namelist())
+        
+        record.stamp = _archive_stamp(archive)
+    elif os.path.isdir(trait_dir):
+        paths, scanned = _scan_folder_paths(trait_dir)
+        _add_paths(record, paths)
+        record.stamp = _folder_stamp(trait_dir, scanned)
+    
+    return record
+
+def _relative(record, path):
+    return os.path.relpath(path, record.trait_dir).replace(os.sep, '/')
+
+def _absolute(trait_dir, rel):
+    return os.path.join(trait_dir, *rel.split('/'))
+
+def record_to_json(record):
+    return {
+        'archive': record.archive != '',
+        'stamp': record.stamp,
+        'genders': list(record.genders),
+        'blend_files': {g: _relative(record, p) for g, p in record.blend_files.items()},
+        'texture_dirs': {g: _relative(record, p) for g, p in record.texture_dirs.items()},
+        'texture_files': {g: [[_relative(record, p), c] for p, c in files] for g, files in record.texture_files.items()},
+    }
+
+def record_from_json(folder_name, trait_dir, archive, data):
+    # Paths are kept relative, trait_dir can move when the extraction cache is toggled
+    record = TraitRecord(folder_name, trait_dir, archive)
+    record.stamp = data['stamp']
+    record.genders = tuple(data['genders'])
+    record.blend_files = {g: _absolute(trait_dir, p) for g, p in data['blend_files'].items()}
+    record.texture_dirs = {g: _absolute(trait_dir, p) for g, p in data['texture_dirs'].items()}
+    record.texture_files = {g: [(_absolute(trait_dir, p), c) for p, c in files] for g, files in data['texture_files'].items()}
+    
+    return record
+
+def _stamp_is_current(trait_dir, archive, data):
+    if data.get('archive') != (archive != ''):
+        return False
+    
+    try:
+        if archive != '':
+            return _archive_stamp(archive) == data['stamp']
+        
+        # A folder record is stale as soon as any of the folders it was read from changes
+        return _folder_stamp(trait_dir, [rel for rel, mtime in data['stamp']]) == data['stamp']
+    except (OSError, KeyError, TypeError, ValueError):
+        return False
+
+def read_index_cache(directory):
+    try:
+        with open(os.path.join(directory, INDEX_CACHE_NAME)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if data.get('version') != INDEX_CACHE_VERSION:
+        return {}
+    
+    return data.get('traits', {})
+
+def write_index_cache(directory, index):
+    path = os.path.join(directory, INDEX_CACHE_NAME)
+    data = {'version': INDEX_CACHE_VERSION, 'traits': {name: record_to_json(r) for name, r in index.items()}}
+    
+    # Read only asset shares simply don't get a sidecar
+    try:
+        with open(path + '.tmp', 'w') as f:
+            json.dump(data, f)
+        
+        os.replace(path + '.tmp', path)
+    except OSError:
+        pass
+
+def build_trait_index(directory, trait_dir_for=None, use_cache=True):
+    """Build {folder_name: TraitRecord} for a CloneX download folder in a single scandir pass
+    
+    trait_dir_for(folder_name, archive) decides where zipped traits are extracted to, 
+    by default next to the zip. Records are reused from the sidecar file in the folder 
+    for every trait whose zip or folders haven't changed since it was written.
+    """
+    sources = {}
+    
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                sources.setdefault(entry.name, '')
+            elif entry.name.endswith('.zip'):
+                sources[entry.name[:-len('.zip')]] = entry.path
+    
+    cached = read_index_cache(directory) if use_cache else {}
+    index = {}
+    reused = 0
+    
+    for folder_name in sorted(sources):
+        if not (is_base_clone(folder_name) or is_trait_folder(folder_name)):
+            continue
+        
+        archive = sources[folder_name]
+        
+        if archive != '' and trait_dir_for is not None:
+            trait_dir = trait_dir_for(folder_name, archive)
+        else:
+            trait_dir = os.path.join(directory, folder_name)
+        
+        data = cached.get(folder_name)
+        
+        if data is not None and _stamp_is_current(trait_dir, archive, data):
+            index[folder_name] = record_from_json(folder_name, trait_dir, archive, data)
+            reused += 1
+        else:
+            index[folder_name] = read_trait_record(folder_name, trait_dir, archive)
+    
+    if use_cache and (reused != len(index) or set(cached) != set(index)):
+        write_index_cache(directory, index)
+    
+    return index
+
+def find_base_clone(index):
+    for folder_name, record in index.items():
+        if is_base_clone(folder_name):
+            return record
+    
+    return None
@@ -0,0 +1,95 @@
+import os, sys, runpy, types, struct, zlib, importlib, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Downsampled viewport copies of texture files, named after their content hash (see textures.TextureHashes)
+PROXY_DIR = '.easy_clonex_proxies'
+
+# Name this file runs under when a worker runs it by path, see start_pool
+WORKER_RUN_NAME = '__clonex_proxy_worker__'
+
+def proxy_path(directory, content_hash, size):
+    return os.path.join(directory, PROXY_DIR, '{}-{}.png'.format(content_hash, size))
+
+def downsample(pixels, max_size):
+    """Box filter (height, width, 4) pixels down by a whole factor until both sides fit in max_size"""
+    height, width = pixels.shape[:2]
+    factor = max(1, -(-max(width, height) // max_size))
+    height -= height % factor
+    width -= width % factor
+    blocks = pixels[:height, :width].reshape(height // factor, factor, width // factor, factor, pixels.shape[2])
+    
+    return blocks.mean(axis=(1, 3))
+
+def write_png(path, pixels):
+    """Write uint8 (height, width, 4) pixels, first row at the top, as an RGBA PNG"""
+    import numpy
+    
+    height, width = pixels.shape[:2]
+    
+    # Every row starts with its filter type, 0 (none)
+    rows = numpy.zeros((height, width * 4 + 1), dtype=numpy.uint8)
+    rows[:, 1:] = pixels.reshape(height, width * 4)
+    
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+    
+    png = (b'\x89PNG\r\n\x1a\n' 
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)) 
+        + chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)) 
+        + chunk(b'IEND', b''))
+    
+    with open(path + '.tmp', 'wb') as f:
+        f.write(png)
+    
+    os.replace(path + '.tmp', path)
+
+def build_proxy(pixels_path, path, max_size, remove_pixels=False):
+    """Turn decoded pixels saved as .npy (bottom row first, as in Image.pixels) into a proxy PNG
+    
+    Runs in a worker process, only needs numpy
+    """
+    import numpy
+    
+    pixels = numpy.load(pixels_path, mmap_mode='r')
+    small = downsample(pixels, max_size)
+    
+    if pixels.dtype != numpy.uint8:
+        small = small * 255
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_png(path, numpy.clip(small + 0.5, 0, 255).astype(numpy.uint8)[::-1])
+    
+    if remove_pixels:
+        os.remove(pixels_path)
+    
+    return path
+
+def init_worker(package, package_dir):
+    """Import package.proxies in a worker under its real name, jobs are pickled by it
+    
+    The add-on package above clonex_io imports bpy, which workers don't have, so its 
+    parents are registered as plain packages pointing at their folders instead of being run
+    """
+    parents = package.split('.')[:-1]
+    directory = os.path.dirname(package_dir)
+    
+    for depth in range(len(parents), 0, -1):
+        module = types.ModuleType('.'.join(parents[:depth]))
+        module.__path__ = [directory]
+        sys.modules.setdefault(module.__name__, module)
+        directory = os.path.dirname(directory)
+    
+    importlib.import_module(package + '.proxies')
+
+def start_pool(max_workers=None):
+    # Spawned rather than forked, forking Blender takes its threads and GPU context along. 
+    # Workers can't import anything from the add-on before init_worker, so they run this file by path
+    return ProcessPoolExecutor(
+        max_workers=max_workers, 
+        mp_context=multiprocessing.get_context('spawn'), 
+        initializer=runpy.run_path, 
+        initargs=(os.path.abspath(__file__), {'worker_package': __package__}, WORKER_RUN_NAME)
+    )
+
+if __name__ == WORKER_RUN_NAME:
+    init_worker(worker_package, os.path.dirname(os.path.abspath(__file__)))
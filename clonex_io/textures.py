@@ -0,0 +1,118 @@
+import os, json, hashlib
+
+# Sidecar written next to the trait index (see index.INDEX_CACHE_NAME)
+HASH_CACHE_NAME = '.easy_clonex_texture_hashes.json'
+HASH_CHUNK_BYTES = 1024 * 1024
+
+def content_hash(path):
+    """The file size plus a BLAKE2b digest of the contents, so identical textures match whatever they're called"""
+    h = hashlib.blake2b(digest_size=16)
+    size = 0
+    
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            h.update(chunk)
+            size += len(chunk)
+    
+    return '{}-{}'.format(size, h.hexdigest())
+
+class TextureHashes:
+    """Content hashes of texture files, only computed again when a file's size or mtime changes
+    
+    With a directory the hashes are kept in a sidecar file there between sessions
+    """
+    
+    def __init__(self, directory=None):
+        self.path = os.path.join(directory, HASH_CACHE_NAME) if directory is not None else None
+        self.hashes = self._read()
+        self.dirty = False
+    
+    def _read(self):
+        if self.path is None:
+            return {}
+        
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def get(self, path):
+        st = os.stat(path)
+        stamp = [st.st_size, st.st_mtime_ns]
+        known = self.hashes.get(path)
+        
+        if known is not None and known[:2] == stamp:
+            return known[2]
+        
+        digest = content_hash(path)
+        self.hashes[path] = stamp + [digest]
+        self.dirty = True
+        
+        return digest
+    
+    def save(self):
+        if self.path is None or not self.dirty:
+            return
+        
+        # Read only asset shares simply don't get a sidecar
+        try:
+            with open(self.path + '.tmp', 'w') as f:
+                json.dump(self.hashes, f)
+            
+            os.replace(self.path + '.tmp', self.path)
+            self.dirty = False
+        except OSError:
+            pass
+
+# Decoded pixels of texture files, named after their content hash (see TextureHashes)
+PIXEL_CACHE_DIR = '.easy_clonex_pixels'
+
+class PixelCache:
+    """Decoded RGBA pixels of texture files stored as .npy arrays next to the trait index
+    
+    Cached images are memory mapped instead of being decoded again. dtype is 'uint8' 
+    (a quarter of the disk space) or 'float32' (handed to Blender as is). Needs numpy, 
+    which Blender ships with
+    """
+    
+    def __init__(self, directory, dtype='uint8'):
+        self.root = os.path.join(directory, PIXEL_CACHE_DIR)
+        self.dtype = dtype
+    
+    def path(self, content_hash):
+        return os.path.join(self.root, '{}-{}.npy'.format(content_hash, self.dtype))
+    
+    def read(self, source_path, content_hash):
+        """Memory map the cached (height, width, 4) pixels, None when they're missing or older than the source"""
+        import numpy
+        
+        path = self.path(content_hash)
+        
+        try:
+            if os.stat(path).st_mtime_ns < os.stat(source_path).st_mtime_ns:
+                return None
+            
+            return numpy.load(path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+    
+    def write(self, content_hash, pixels):
+        """pixels is a float32 (height, width, 4) array as read from Image.pixels"""
+        import numpy
+        
+        if self.dtype == 'uint8':
+            pixels = numpy.clip(pixels * 255 + 0.5, 0, 255).astype(numpy.uint8)
+        
+        path = self.path(content_hash)
+        
+        # Read only asset shares simply don't get a cache
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            
+            with open(path + '.tmp', 'wb') as f:
+                numpy.save(f, pixels)
+            
+            os.replace(path + '.tmp', path)
+        except OSError:
+            pass
@@ -1,20 +1,282 @@
 import bpy, os, zipfile
+from concurrent.futures import ThreadPoolExecutor
 import bpy.utils.previews
 from pathlib import Path
-from bpy.types import Scene, Panel, PropertyGroup, Operator
-from bpy.props import StringProperty, BoolProperty
+from bpy.types import Scene, Panel, PropertyGroup, Operator, AddonPreferences
+from bpy.props import StringProperty, BoolProperty, IntProperty, FloatProperty, EnumProperty, PointerProperty
 from math import radians
 from mathutils import Matrix
+from bpy.app.handlers import persistent
 from . easybpy import *
+from . clonex_io import extract, cache, index, blendfile, readahead, textures, proxies
 
-BSDF_NODE_INDEX_DICT = {
-    'BSDF_INPUT_BASE_COLOR_INDEX': 0,
-    'BSDF_INPUT_METALLIC_INDEX': 6,
-    'BSDF_INPUT_ROUGHNESS_INDEX': 9,
-    'BSDF_INPUT_EMISSION_INDEX': 19,
-    'BSDF_INPUT_NORMAL_INDEX': 22
+# Every DNA material is a copy of one template material around a shared node group, 
+# so only the image datablocks change per clone
+DNA_NODE_GROUP_NAME = 'CloneX DNA'
+DNA_TEMPLATE_NAME = 'CloneX DNA Template'
+
+# Texture channel: (group input, Principled BSDF inputs it may be called newest first, image colorspace, value without a map)
+DNA_CHANNELS = {
+    'd': ('Base Color', ('Base Color',), None, (0.8, 0.8, 0.8, 1.0)),
+    'm': ('Metallic', ('Metallic',), 'Non-Color', (0.0, 0.0, 0.0, 1.0)),
+    'r': ('Roughness', ('Roughness',), 'Non-Color', (0.5, 0.5, 0.5, 1.0)),
+    'e': ('Emission', ('Emission Color', 'Emission'), 'Non-Color', (0.0, 0.0, 0.0, 1.0)),
+    'n': ('Normal', ('Normal',), 'Non-Color', (0.5, 0.5, 1.0, 1.0)),
 }
 
+def get_addon_preferences():
+    addon = bpy.context.preferences.addons.get(__package__)
+    
+    return addon.preferences if addon is not None else None
+
+def get_extract_workers():
+    prefs = get_addon_preferences()
+    
+    return prefs.extract_workers if prefs is not None else 0
+
+def get_cache_root(subdir):
+    prefs = get_addon_preferences()
+    
+    if prefs is not None and prefs.cache_dir != '':
+        return os.path.join(bpy.path.abspath(prefs.cache_dir), subdir)
+    
+    return bpy.utils.user_resource('DATAFILES', path=os.path.join('easy_clonex', subdir), create=True)
+
+_extraction_cache = None
+
+# Bumped whenever the way a clone is assembled changes, so older snapshots are ignored
+SNAPSHOT_VERSION = 2
+
+def get_extraction_cache():
+    global _extraction_cache
+    
+    prefs = get_addon_preferences()
+    
+    if prefs is None or not prefs.use_extraction_cache:
+        return None
+    
+    root = get_cache_root('extracted')
+    max_bytes = int(prefs.cache_size_gb * 1024 ** 3)
+    
+    if _extraction_cache is None or _extraction_cache.root != root:
+        _extraction_cache = cache.ExtractionCache(root, max_bytes)
+    
+    _extraction_cache.max_bytes = max_bytes
+    
+    return _extraction_cache
+
+def get_snapshot_cache():
+    prefs = get_addon_preferences()
+    
+    # Linked clones keep pointing at their libraries, there is nothing assembled to save
+    if prefs is None or not prefs.use_snapshot_cache or prefs.link_trait_libraries:
+        return None
+    
+    return cache.SnapshotCache(get_cache_root('snapshots'), int(prefs.snapshot_cache_gb * 1024 ** 3))
+
+def get_snapshot_key(base_clone, traits, gender):
+    # Snapshots are written by this version of Blender, a newer one reassembles the clone
+    sources = [(r.folder_name, r.stamp) for r in [base_clone] + traits]
+    
+    return cache.snapshot_key(gender, sources, [r.folder_name for r in traits], [SNAPSHOT_VERSION, list(bpy.app.version)])
+
+def load_clone_snapshot(filepath, collection_names):
+    """Append the assembled clone's collections from a snapshot and link them to the scene"""
+    previous_images = set(bpy.data.images)
+    
+    with bpy.data.libraries.load(filepath) as (data_from, data_to):
+        data_to.collections = [name for name in data_from.collections if name in collection_names]
+    
+    collections = [c for c in data_to.collections if c is not None]
+    
+    if len(collections) != len(collection_names):
+        bpy.data.batch_remove(collections)
+        raise RuntimeError('Snapshot ' + filepath + ' is missing collections')
+    
+    for collection in collections:
+        get_scene().collection.children.link(collection)
+    
+    register_clone_geometry([obj for collection in collections for obj in collection.objects])
+    refill_cached_images([image for image in bpy.data.images if image not in previous_images])
+
+def write_clone_snapshot(snapshot_cache, key, collection_names):
+    collections = {get_collection(name) for name in collection_names if collection_exists(name)}
+    
+    # Proxies only point at their full resolution images by name, which wouldn't be written
+    use_proxies = get_scene().clonex_use_texture_proxies
+    
+    if use_proxies:
+        swap_texture_proxies(False)
+    
+    try:
+        # Absolute paths so the textures still resolve from the cache folder
+        bpy.data.libraries.write(snapshot_cache.temp_path(key), collections, path_remap='ABSOLUTE')
+        snapshot_cache.commit(key)
+    except OSError as e:
+        snapshot_cache.discard(key)
+        print('Could not write the clone snapshot: ' + str(e))
+    finally:
+        if use_proxies:
+            swap_texture_proxies(True)
+
+def get_trait_dir(folder_name, archive):
+    # Zipped traits live in the shared extraction cache when it is enabled
+    extraction_cache = get_extraction_cache()
+    
+    if extraction_cache is not None:
+        return extraction_cache.entry_dir(archive)
+    
+    return os.path.join(os.path.dirname(archive), folder_name)
+
+def get_trait_folder_name(item):
+    # Cache entries are named by content, so the archive keeps the original folder name
+    return Path(item.trait_archive).stem if item.trait_archive != '' else Path(item.trait_dir).name
+
+# (archive, gender) pairs that have already been extracted during this session
+_extracted_archives = set()
+
+def get_scene_archives(loaded_only=False):
+    """The base clone archive and the trait archives of the scene, with loaded_only just the ones it uses"""
+    scene = get_scene()
+    archives = [scene.clonex_base_archive] if scene.clonex_base_archive != '' else []
+    
+    for item in scene.clonex_trait_collection:
+        if item.trait_archive != '' and (not loaded_only or item.trait_selected or collection_exists(item.trait_name)):
+            archives.append(item.trait_archive)
+    
+    return archives
+
+def restore_extracted_archives():
+    """Extract the cache entries a reopened file points into again when they were evicted since it was saved"""
+    if get_extraction_cache() is None:
+        return
+    
+    archives = [a for a in get_scene_archives(loaded_only=True) if os.path.isfile(a)]
+    
+    if len(archives) == 0:
+        return
+    
+    gender = get_scene().clonex_gender
+    _extracted_archives.difference_update((a, gender) for a in archives)
+    extract_trait_archives([(a, get_trait_dir(Path(a).stem, a)) for a in archives], gender)
+    
+    # Libraries that were missing when the file opened can be read now
+    for library in bpy.data.libraries:
+        if library.is_missing and os.path.isfile(bpy.path.abspath(library.filepath)):
+            library.reload()
+
+def start_trait_extraction(archives, gender, progress=None):
+    """Returns a function that extracts the archives and can safely run off the main thread
+    
+    Everything that needs bpy (preferences, the scene) is read here, up front
+    """
+    pending = [a for a in archives if (a[0], gender) not in _extracted_archives]
+    extraction_cache = get_extraction_cache()
+    max_workers = get_extract_workers()
+    
+    # Don't let the cache evict anything the current scene was built from
+    in_use = get_scene_archives()
+    
+    # Linked files read their data straight from the cache entries for as long as they exist
+    pin = use_linked_libraries()
+    
+    def run():
+        if extraction_cache is not None:
+            extraction_cache.extract([a[0] for a in pending], gender, max_workers, keep=in_use, progress=progress)
+            
+            if pin:
+                extraction_cache.pin([a[0] for a in pending])
+        else:
+            extract.extract_archives(pending, gender, max_workers, progress)
+        
+        _extracted_archives.update((a[0], gender) for a in pending)
+    
+    return run
+
+def extract_trait_archives(archives, gender):
+    start_trait_extraction(archives, gender)()
+
+# Trait indexes for every CloneX folder opened this session, keyed by folder
+_trait_indexes = {}
+
+def get_trait_index(directory, rebuild=False):
+    if rebuild or directory not in _trait_indexes:
+        _trait_indexes[directory] = index.build_trait_index(directory, get_trait_dir)
+    
+    return _trait_indexes[directory]
+
+def get_trait_record(item):
+    directory = get_scene().clonex_home_dir
+    
+    if directory == '':
+        # Files saved before the home dir was stored
+        directory = os.path.dirname(item.trait_archive if item.trait_archive != '' else item.trait_dir)
+    
+    return get_trait_index(directory).get(get_trait_folder_name(item))
+
+def get_readahead_budget():
+    prefs = get_addon_preferences()
+    
+    return prefs.readahead_budget_mb * 1024 ** 2 if prefs is not None else 0
+
+# The running read-ahead, and files already warmed by earlier ones
+_readahead = None
+_warmed_paths = set()
+
+def get_readahead_paths():
+    gender = get_scene().clonex_gender
+    paths = []
+    
+    # Traits that haven't been loaded yet, in the order they are listed
+    for item in get_scene().clonex_trait_collection:
+        if item.trait_selected or collection_exists(item.trait_name):
+            continue
+        
+        record = get_trait_record(item)
+        
+        if record is None:
+            continue
+        
+        trait_files = [record.blend_files[gender]] if gender in record.blend_files else []
+        trait_files += [path for path, suffix in record.texture_files.get(gender, [])]
+        
+        if record.archive != '' and (len(trait_files) == 0 or not os.path.exists(trait_files[0])):
+            # Still zipped, equipping it starts by reading the archive
+            trait_files = [record.archive]
+        
+        paths.extend(trait_files)
+    
+    return paths
+
+def start_readahead():
+    """Warm the page cache for the traits that aren't loaded yet, the thread never touches bpy"""
+    global _readahead
+    
+    stop_readahead()
+    budget = get_readahead_budget()
+    
+    if budget <= 0 or not get_scene().clonex_loaded:
+        return
+    
+    paths = [path for path in get_readahead_paths() if path not in _warmed_paths]
+    
+    if len(paths) > 0:
+        _readahead = readahead.ReadAhead(paths, budget)
+        _readahead.start()
+
+def stop_readahead():
+    # Called before anything that reads files itself, so the two don't compete for the disk
+    global _readahead
+    
+    if _readahead is not None:
+        _readahead.stop()
+        _warmed_paths.update(_readahead.warmed)
+        _readahead = None
+
+def is_trait_equipped_by_default(trait_display_name):
+    # Only equip one of the bottoms initially
+    return not ('Bottoms - Tech' in trait_display_name or 'Bottoms - Leggings' in trait_display_name)
+
 def setup_viewport(context):
     # Move the camera into a better starting position
     mat_loc = Matrix.Translation((0, -10, 2))
@@ -40,204 +302,1072 @@ def setup_viewport(context):
             if space.type == 'VIEW_3D':
                 space.shading.type = 'MATERIAL'
 
-def apply_dna_textures_to_object(filepath, geo_object):
-    base_mat = get_material_from_object(geo_object)
+def find_socket(sockets, names):
+    # Socket indices move between Blender versions, their names mostly don't
+    for name in names:
+        if name in sockets:
+            return sockets[name]
+
+def new_group_socket(group, name, in_out, socket_type):
+    if hasattr(group, 'interface'):
+        return group.interface.new_socket(name, in_out=in_out, socket_type=socket_type)
     
-    dna_mat_name = 'Dna_Head' if base_mat.name == 'Head' else 'Dna_Suit'   
-    dna_mat = get_material(dna_mat_name)
+    # Blender 3.x
+    sockets = group.inputs if in_out == 'INPUT' else group.outputs
     
-    if dna_mat is None:
-        dna_mat = create_material(dna_mat_name)
-        dna_mat.use_nodes = True
+    return sockets.new(socket_type, name)
 
-        dna_nodes = get_nodes(dna_mat)
-        dna_bsdf = get_node(dna_nodes, 'Principled BSDF')
-        dna_bsdf.subsurface_method = 'BURLEY'
+def get_dna_node_group():
+    group = get_node_group(DNA_NODE_GROUP_NAME)
+    
+    if group is not None:
+        return group
+    
+    group = bpy.data.node_groups.new(DNA_NODE_GROUP_NAME, 'ShaderNodeTree')
+    group.use_fake_user = True
+    
+    for channel, (name, bsdf_names, colorspace, default) in DNA_CHANNELS.items():
+        new_group_socket(group, name, 'INPUT', 'NodeSocketColor').default_value = default
+    
+    new_group_socket(group, 'BSDF', 'OUTPUT', 'NodeSocketShader')
+    
+    nodes = group.nodes
+    group_input = create_node(nodes, 'NodeGroupInput')
+    group_output = create_node(nodes, 'NodeGroupOutput')
+    bsdf = create_node(nodes, 'ShaderNodeBsdfPrincipled')
+    bsdf.subsurface_method = 'BURLEY'
+    
+    # Blender 4 defaults the emission strength to 0, 3.x to 1
+    emission_strength = find_socket(bsdf.inputs, ('Emission Strength',))
+    
+    if emission_strength is not None:
+        emission_strength.default_value = 1.0
+    
+    for channel, (name, bsdf_names, colorspace, default) in DNA_CHANNELS.items():
+        input_socket = find_socket(bsdf.inputs, bsdf_names)
+        
+        if input_socket is None:
+            print('No ' + name + ' input on the Principled BSDF, the DNA ' + name + ' map is ignored')
+            continue
         
-        # Load all of the image files
-        image_exts = ['.png', '.jpg', '.jpeg']
+        if channel == 'n':
+            # Normal maps go through a normal map node
+            normal_node = create_node(nodes, 'ShaderNodeNormalMap')
+            create_node_link(group_input.outputs[name], normal_node.inputs['Color'])
+            create_node_link(normal_node.outputs['Normal'], input_socket)
+        else:
+            create_node_link(group_input.outputs[name], input_socket)
+    
+    create_node_link(bsdf.outputs['BSDF'], group_output.inputs['BSDF'])
+    
+    return group
 
-        for path in [p for p in Path(filepath).rglob('*') if p.suffix in image_exts]:
-            if get_image(path.name) is None:
-                bpy.data.images.load(str(path.resolve()), check_existing=True)
-                
-                filename = path.stem
-                
-                tex_node = create_node(dna_nodes, "ShaderNodeTexImage")
-                tex_node.image = get_image(path.name)
-                
-                tokens = filename.split('_')
-                suffix = tokens[len(tokens)-1]
-                
-                if suffix == 'd':
-                    # This is a base color image
-                    output_socket = tex_node.outputs[0]
-                    input_socket = dna_bsdf.inputs[BSDF_NODE_INDEX_DICT['BSDF_INPUT_BASE_COLOR_INDEX']]
-
-                    if not input_socket.is_linked:
-                        create_node_link(output_socket, input_socket)
-                elif suffix == 'm':
-                    # This is a metallic image
-                    output_socket = tex_node.outputs[0]
-                    input_socket = dna_bsdf.inputs[BSDF_NODE_INDEX_DICT['BSDF_INPUT_METALLIC_INDEX']]
-
-                    if not input_socket.is_linked:
-                        create_node_link(output_socket, input_socket)
-
-                    tex_node.image.colorspace_settings.name = 'Non-Color'
-                elif suffix == 'r':
-                    # This is a roughness image
-                    output_socket = tex_node.outputs[0]
-                    input_socket = dna_bsdf.inputs[BSDF_NODE_INDEX_DICT['BSDF_INPUT_ROUGHNESS_INDEX']]
-
-                    if not input_socket.is_linked:
-                        create_node_link(output_socket, input_socket)
-                    
-                    tex_node.image.colorspace_settings.name = 'Non-Color'
-                elif suffix == 'e':
-                    # This is an emission image 
-                    output_socket = tex_node.outputs[0]
-                    input_socket = dna_bsdf.inputs[BSDF_NODE_INDEX_DICT['BSDF_INPUT_EMISSION_INDEX']]
-
-                    if not input_socket.is_linked:
-                        create_node_link(output_socket, input_socket)
-                    
-                    tex_node.image.colorspace_settings.name = 'Non-Color'
-                elif suffix == 'n':
-                    # This is a normal mapping image
-                    # Need to create a normal map node between the texture image and BSDF node
-                    normal_node = create_node(dna_nodes, "ShaderNodeNormalMap")
-                    
-                    normal_output_socket = normal_node.outputs[0]
-                    input_socket = dna_bsdf.inputs[BSDF_NODE_INDEX_DICT['BSDF_INPUT_NORMAL_INDEX']]
-
-                    if not input_socket.is_linked:
-                        create_node_link(normal_output_socket, input_socket)
-                    
-                    create_node_link(tex_node.outputs[0], normal_node.inputs[1])
-                    
-                    tex_node.image.colorspace_settings.name = 'Non-Color'
-                else:
-                    # Not a valid texture image, remove both the image and the node
-                    delete_image(tex_node.image)
-                    delete_node(dna_nodes, tex_node)   
+def get_dna_template():
+    template = get_material(DNA_TEMPLATE_NAME)
+    
+    if template is not None:
+        return template
+    
+    template = create_material(DNA_TEMPLATE_NAME)
+    template.use_fake_user = True
+    template.use_nodes = True
+    
+    nodes = get_nodes(template)
+    delete_node(nodes, 'Principled BSDF')
+    group_node = create_node(nodes, 'ShaderNodeGroup')
+    group_node.node_tree = get_dna_node_group()
+    create_node_link(group_node.outputs['BSDF'], get_node(nodes, 'Material Output').inputs['Surface'])
+    
+    # One image node per channel, named after it so instances can find them
+    for channel, (name, bsdf_names, colorspace, default) in DNA_CHANNELS.items():
+        tex_node = create_node(nodes, 'ShaderNodeTexImage')
+        tex_node.name = name
+        create_node_link(tex_node.outputs['Color'], group_node.inputs[name])
+    
+    return template
+
+# Custom property holding the content hash an image was loaded for
+IMAGE_HASH_PROP = 'clonex_content_hash'
+
+# Custom property holding the texture file an image filled from the pixel cache stands for
+PIXEL_SOURCE_PROP = 'clonex_pixel_source'
+
+_texture_hashes = {}
+_images_by_hash = {}
+
+def get_texture_hashes():
+    directory = get_scene().clonex_home_dir
+    
+    if directory not in _texture_hashes:
+        _texture_hashes[directory] = textures.TextureHashes(directory if directory != '' else None)
+    
+    return _texture_hashes[directory]
+
+def get_pixel_cache():
+    prefs = get_addon_preferences()
+    directory = get_scene().clonex_home_dir
+    
+    if prefs is None or not prefs.use_pixel_cache or directory == '':
+        return None
+    
+    return textures.PixelCache(directory, 'float32' if prefs.pixel_cache_format == 'FLOAT' else 'uint8')
+
+def fill_image_pixels(image, pixels):
+    import numpy
+    
+    if pixels.dtype == numpy.uint8:
+        pixels = pixels.astype(numpy.float32)
+        pixels *= 1 / 255
+    
+    image.pixels.foreach_set(pixels.reshape(-1))
+    image.update()
+
+def load_cached_image(path, content_hash, pixel_cache):
+    # Filled straight from the memory mapped array, the PNG or JPG is never decoded
+    pixels = pixel_cache.read(path, content_hash)
+    
+    if pixels is None:
+        return None
+    
+    height, width = pixels.shape[:2]
+    image = bpy.data.images.new(os.path.basename(path), width, height, alpha=True)
+    fill_image_pixels(image, pixels)
+    image[PIXEL_SOURCE_PROP] = path
+    
+    return image
+
+def cache_image_pixels(image, content_hash, pixel_cache):
+    import numpy
+    
+    width, height = image.size
+    
+    # Float images (EXR, HDR) would lose precision as uint8, they're decoded as usual
+    if image.is_float or image.channels != 4 or width * height == 0:
+        return
+    
+    pixels = numpy.empty(width * height * 4, dtype=numpy.float32)
+    image.pixels.foreach_get(pixels)
+    pixel_cache.write(content_hash, pixels.reshape(height, width, 4))
+
+def refill_cached_images(images=None):
+    """Give images filled from the pixel cache their pixels back, they aren't saved with the file"""
+    pixel_cache = get_pixel_cache()
+    texture_hashes = get_texture_hashes()
+    
+    for image in (bpy.data.images if images is None else images):
+        path = image.get(PIXEL_SOURCE_PROP)
+        
+        if path is None or image.packed_file is not None:
+            continue
+        
+        pixels = None
+        
+        try:
+            if pixel_cache is not None:
+                pixels = pixel_cache.read(path, texture_hashes.get(path))
+        except OSError:
+            pass
+        
+        if pixels is not None and tuple(image.size) == (pixels.shape[1], pixels.shape[0]):
+            fill_image_pixels(image, pixels)
+        else:
+            # No cache (any more), go back to reading the texture file
+            image.source = 'FILE'
+            image.filepath = path
+            del image[PIXEL_SOURCE_PROP]
+            image.reload()
+
+# Custom properties linking a full resolution texture and its viewport proxy, by image name
+PROXY_PROP = 'clonex_proxy'
+PROXY_SOURCE_PROP = 'clonex_proxy_source'
+# Scene custom property holding render.use_lock_interface from before proxies were turned on
+LOCK_INTERFACE_PROP = 'clonex_previous_lock_interface'
+
+# Seconds between checks on the proxy workers
+PROXY_POLL_INTERVAL = 0.5
+
+_proxy_executor = None
+_proxy_jobs = {}
+
+def get_proxy_size():
+    prefs = get_addon_preferences()
+    
+    return int(prefs.proxy_size) if prefs is not None else 1024
+
+def get_proxy_executor():
+    global _proxy_executor
+    
+    if _proxy_executor is None:
+        _proxy_executor = proxies.start_pool(get_extract_workers() or None)
+    
+    return _proxy_executor
+
+def get_texture_proxy(image):
+    name = image.get(PROXY_PROP)
+    
+    return bpy.data.images.get(name) if name is not None else None
+
+def dump_image_pixels(image, content_hash):
+    # Workers can't decode PNG or JPG without bpy, they're handed the pixel cache file, 
+    # or a dump that they remove once the proxy is written
+    pixel_cache = get_pixel_cache()
+    remove = pixel_cache is None
+    
+    if remove:
+        pixel_cache = textures.PixelCache(get_scene().clonex_home_dir)
+    
+    path = pixel_cache.path(content_hash)
+    
+    if os.path.isfile(path):
+        return path, False
+    
+    cache_image_pixels(image, content_hash, pixel_cache)
+    
+    return (path, remove) if os.path.isfile(path) else (None, False)
+
+def load_texture_proxy(image, path):
+    proxy = bpy.data.images.load(path, check_existing=True)
+    proxy.name = image.name + ' (proxy)'
+    proxy.colorspace_settings.name = image.colorspace_settings.name
+    proxy[PROXY_SOURCE_PROP] = image.name
+    image[PROXY_PROP] = proxy.name
+
+def swap_texture_proxies(use_proxies):
+    """Point every image node at the viewport proxies, or back at the full resolution textures"""
+    for material in bpy.data.materials:
+        if material.node_tree is None:
+            continue
+        
+        for node in material.node_tree.nodes:
+            if node.type != 'TEX_IMAGE' or node.image is None:
+                continue
+            
+            if use_proxies:
+                other = get_texture_proxy(node.image)
+            else:
+                name = node.image.get(PROXY_SOURCE_PROP)
+                other = bpy.data.images.get(name) if name is not None else None
+            
+            if other is not None:
+                # The image that isn't used keeps a fake user, or reclaiming orphans would delete it
+                node.image.use_fake_user = True
+                other.use_fake_user = False
+                node.image = other
+
+def request_texture_proxies(images):
+    """Swap in viewport proxies for full resolution textures, building the missing ones in worker processes"""
+    scene = get_scene()
+    directory = scene.clonex_home_dir
+    
+    if not scene.clonex_use_texture_proxies or directory == '':
+        return
+    
+    size = get_proxy_size()
+    
+    for image in list(images):
+        content_hash = image.get(IMAGE_HASH_PROP)
+        
+        if content_hash is None or get_texture_proxy(image) is not None or content_hash in _proxy_jobs:
+            continue
+        
+        path = proxies.proxy_path(directory, content_hash, size)
+        
+        if os.path.isfile(path):
+            load_texture_proxy(image, path)
+            continue
+        
+        pixels_path, remove_pixels = dump_image_pixels(image, content_hash)
+        
+        if pixels_path is not None:
+            future = get_proxy_executor().submit(proxies.build_proxy, pixels_path, path, size, remove_pixels)
+            _proxy_jobs[content_hash] = (image.name, future)
+    
+    if len(_proxy_jobs) > 0 and not bpy.app.timers.is_registered(poll_texture_proxies):
+        bpy.app.timers.register(poll_texture_proxies, first_interval=PROXY_POLL_INTERVAL)
+    
+    swap_texture_proxies(True)
+
+def poll_texture_proxies():
+    finished = False
+    
+    for content_hash, (image_name, future) in list(_proxy_jobs.items()):
+        if not future.done():
+            continue
+        
+        del _proxy_jobs[content_hash]
+        image = bpy.data.images.get(image_name)
+        
+        try:
+            path = future.result()
+        except Exception as e:
+            print('Could not build a proxy for ' + image_name + ': ' + str(e))
+            continue
+        
+        if image is not None:
+            load_texture_proxy(image, path)
+            finished = True
+    
+    if finished and get_scene().clonex_use_texture_proxies:
+        swap_texture_proxies(True)
+    
+    return PROXY_POLL_INTERVAL if len(_proxy_jobs) > 0 else None
+
+def stop_texture_proxies():
+    global _proxy_executor
+    
+    _proxy_jobs.clear()
+    
+    if bpy.app.timers.is_registered(poll_texture_proxies):
+        bpy.app.timers.unregister(poll_texture_proxies)
+    
+    if _proxy_executor is not None:
+        _proxy_executor.shutdown(wait=False, cancel_futures=True)
+        _proxy_executor = None
+
+def update_texture_proxies(self, context):
+    if self.clonex_use_texture_proxies:
+        # Renders swap to full resolution in render_pre, the interface has to wait for that
+        if self.get(LOCK_INTERFACE_PROP) is None:
+            self[LOCK_INTERFACE_PROP] = self.render.use_lock_interface
+        
+        self.render.use_lock_interface = True
+        request_texture_proxies(image for image in bpy.data.images if image.get(IMAGE_HASH_PROP) is not None)
+    else:
+        swap_texture_proxies(False)
+        
+        # Put back whatever the user had before proxies were turned on
+        if self.get(LOCK_INTERFACE_PROP) is not None:
+            self.render.use_lock_interface = bool(self[LOCK_INTERFACE_PROP])
+            del self[LOCK_INTERFACE_PROP]
+
+@persistent
+def clonex_render_pre(scene):
+    if scene.clonex_use_texture_proxies:
+        swap_texture_proxies(False)
+
+@persistent
+def clonex_render_done(scene):
+    # Registered for both render_complete and render_cancel
+    if scene.clonex_use_texture_proxies:
+        swap_texture_proxies(True)
+
+def load_texture_image(path, texture_hashes):
+    """Load an image once per distinct content, every file with the same bytes shares the datablock"""
+    content_hash = texture_hashes.get(path)
+    image = _images_by_hash.get(content_hash)
+    
+    try:
+        if image is not None and image.get(IMAGE_HASH_PROP) == content_hash:
+            return image
+    except ReferenceError:
+        # Removed since, e.g. by unloading a trait
+        pass
+    
+    # Images loaded before the file was saved and reopened still carry their hash
+    image = next((i for i in bpy.data.images if i.get(IMAGE_HASH_PROP) == content_hash), None)
+    
+    pixel_cache = get_pixel_cache() if image is None else None
+    
+    if pixel_cache is not None:
+        image = load_cached_image(path, content_hash, pixel_cache)
+    
+    if image is None:
+        image = bpy.data.images.load(path, check_existing=True)
+        
+        if pixel_cache is not None:
+            cache_image_pixels(image, content_hash, pixel_cache)
+    
+    image[IMAGE_HASH_PROP] = content_hash
+    
+    _images_by_hash[content_hash] = image
+    
+    return image
+
+# Clone part: (substring of its object's name, base material name, DNA material name)
+GEOMETRY_PARTS = {
+    'head': ('HeadGeo', 'Head', 'Dna_Head'),
+    'suit': ('SuitGeo', 'Suit', 'Dna_Suit'),
+}
+
+def register_clone_geometry(objects):
+    """Remember the clone's head and suit objects and their materials, so trait toggles never search the scene
+    
+    Stored as pointer properties on the scene, which follow renames and are saved with the file
+    """
+    geometry = get_scene().clonex_geometry
+    
+    for part, (object_name, base_name, dna_name) in GEOMETRY_PARTS.items():
+        # These head and suit objects can have varying names, so do some fuzzy matching
+        obj = next((o for o in objects if o.type == 'MESH' and object_name in o.name), None)
+        
+        if obj is None:
+            continue
+        
+        materials = [slot.material for slot in obj.material_slots if slot.material is not None]
+        
+        if len(materials) == 0:
+            continue
+        
+        # With DNA textures applied (e.g. from a snapshot) the base material is in the last slot
+        base_mat = next((m for m in materials if m.name == base_name), materials[-1])
+        
+        setattr(geometry, part + '_object', obj)
+        setattr(geometry, part + '_material', base_mat)
+        
+        if materials[0] != base_mat:
+            setattr(geometry, part + '_dna_material', materials[0])
+
+def get_clone_geometry(part):
+    """(object, base material, DNA material) of a clone part, any of them None when it isn't there"""
+    geometry = get_scene().clonex_geometry
+    
+    if getattr(geometry, part + '_object') is None:
+        # Files saved before the registry existed are searched once
+        register_clone_geometry(get_objects_including(GEOMETRY_PARTS[part][0]))
+    
+    return getattr(geometry, part + '_object'), getattr(geometry, part + '_material'), getattr(geometry, part + '_dna_material')
+
+def get_geometry_part(geo_object):
+    for part in GEOMETRY_PARTS:
+        if get_clone_geometry(part)[0] == geo_object:
+            return part
+    
+    # Not registered, fall back to the material the object started with
+    return 'head' if get_material_from_object(geo_object).name == 'Head' else 'suit'
+
+def apply_dna_textures_to_object(texture_files, geo_object):
+    part = get_geometry_part(geo_object)
+    base_mat, dna_mat = get_clone_geometry(part)[1:]
+    dna_mat_name = GEOMETRY_PARTS[part][2]
+    
+    if base_mat is None:
+        base_mat = get_material_from_object(geo_object)
+    
+    if dna_mat is None:
+        # Built before the registry existed
+        dna_mat = get_material(dna_mat_name)
+    
+    if dna_mat is None:
+        dna_mat = get_dna_template().copy()
+        dna_mat.name = dna_mat_name
+        dna_mat.use_fake_user = False
+        dna_nodes = get_nodes(dna_mat)
+        
+        # The trait index already knows which channel each image is for
+        images = {}
+        texture_hashes = get_texture_hashes()
+        
+        for path, suffix in texture_files:
+            if suffix in DNA_CHANNELS and suffix not in images:
+                images[suffix] = load_texture_image(path, texture_hashes)
+        
+        texture_hashes.save()
+        
+        for channel, (name, bsdf_names, colorspace, default) in DNA_CHANNELS.items():
+            tex_node = get_node(dna_nodes, name)
+            
+            if channel not in images:
+                # The group input's default value stands in for the missing map
+                delete_node(dna_nodes, tex_node)
+                continue
+            
+            tex_node.image = images[channel]
             
+            if colorspace is not None:
+                tex_node.image.colorspace_settings.name = colorspace
+        
+        request_texture_proxies(images.values())
+        
         # Add the new material to the geo_object       
-        add_material_to_object(geo_object, dna_mat)
+        if geo_object.data.library is None:
+            add_material_to_object(geo_object, dna_mat)
+    
+    setattr(get_scene().clonex_geometry, part + '_dna_material', dna_mat)
+    
+    if geo_object.data.library is not None:
+        # Linked mesh data can't be edited, so the override's own slot holds the dna material
+        geo_object.material_slots[0].link = 'OBJECT'
+        geo_object.material_slots[0].material = dna_mat
+        return
     
     # Swap the material_slots for the base and dna materials
     geo_object.material_slots[0].material = dna_mat
     geo_object.material_slots[len(geo_object.material_slots)-1].material = base_mat
     
 def remove_dna_textures_from_object(geo_object):
-    base_mat = geo_object.material_slots[len(geo_object.material_slots)-1]
-    base_mat_name = 'Head' if base_mat.name == 'Head' else 'Suit'
+    if geo_object.data.library is not None:
+        # Falls back to the material on the linked mesh
+        geo_object.material_slots[0].link = 'DATA'
+        return
     
-    if geo_object.material_slots[0].material.name != get_material(base_mat_name).name:
-        base_mat = get_material(base_mat_name)
+    base_mat = get_clone_geometry(get_geometry_part(geo_object))[1]
+    
+    if base_mat is not None and geo_object.material_slots[0].material != base_mat:
         dna_mat = geo_object.material_slots[0].material
         
         geo_object.material_slots[0].material = base_mat
         geo_object.material_slots[len(geo_object.material_slots)-1].material = dna_mat
 
-def load_clonex_trait_files_into_collection(trait_collection, filepath):
-    with bpy.data.libraries.load(filepath) as (data_from, data_to):
+def use_linked_libraries():
+    prefs = get_addon_preferences()
+    
+    return prefs is not None and prefs.link_trait_libraries
+
+def get_clone_armature():
+    # Linked trait files can bring their own copy of the armature, the local one (or its override) wins
+    name = 'Genesis8_1' + get_scene().clonex_gender.capitalize()
+    armatures = [obj for obj in bpy.data.objects if obj.name == name]
+    local = [obj for obj in armatures if obj.library is None]
+    
+    return local[0] if len(local) > 0 else (armatures[0] if len(armatures) > 0 else None)
+
+def get_armature_modifier(obj):
+    return (get_modifier(obj, 'Armature') 
+        if get_modifier(obj, 'Armature') 
+        else get_modifier(obj, 'Genesis8_1' + get_scene().clonex_gender.capitalize()))
+
+def override_linked_objects(objects):
+    """Override the linked objects, replacing them in every collection they were linked into
+    
+    remap_local_usages only reaches users that are already local, so parents and armature 
+    modifiers of the overrides made after a rig's are pointed at its override afterwards
+    """
+    overrides = [obj.override_create(remap_local_usages=True) if obj.library is not None else obj for obj in objects]
+    by_reference = {obj.override_library.reference: obj for obj in overrides if obj.override_library is not None}
+    
+    for obj in overrides:
+        if obj.parent in by_reference:
+            obj.parent = by_reference[obj.parent]
+        
+        for mod in obj.modifiers:
+            if mod.type == 'ARMATURE' and mod.object in by_reference:
+                mod.object = by_reference[mod.object]
+    
+    return overrides
+
+def follows_armature(obj):
+    return obj.type == 'MESH' and (
+        any(mod.type == 'ARMATURE' for mod in obj.modifiers) 
+        or (obj.parent is not None and obj.parent.type == 'ARMATURE'))
+
+def load_base_clone_into_collection(collection, filepath):
+    link = use_linked_libraries()
+    
+    with bpy.data.libraries.load(filepath, link=link) as (data_from, data_to):
         data_to.objects = data_from.objects
-                            
-    link_objects_to_collection(data_to.objects, trait_collection)
     
-    # Get all mesh objects from the collection and update their Armature modifiers
-    objects = get_objects_from_collection(trait_collection)
+    objects = [obj for obj in data_to.objects if obj is not None]
+    link_objects_to_collection(objects, collection)
     
-    for obj in objects:
-        if obj.type == 'MESH':
-            # Clear the parent, then update the armature modifier
-            select_only(obj)
-            bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
-            
-            armature_mod = (get_modifier(obj, 'Armature') 
-                if get_modifier(obj, 'Armature') 
-                else get_modifier(obj, 'Genesis8_1' + get_scene().clonex_gender.capitalize()))
-            
-            if armature_mod is not None:
-                armature_mod.object = get_object('Genesis8_1' + get_scene().clonex_gender.capitalize())
+    if link:
+        # Only the armature (so it can be posed), the meshes it deforms (so they follow its 
+        # override) and the geometry that gets DNA materials are edited
+        objects = override_linked_objects([
+            obj for obj in objects 
+            if obj.type == 'ARMATURE' or follows_armature(obj) or 'HeadGeo' in obj.name or 'SuitGeo' in obj.name
+        ])
+    
+    register_clone_geometry(objects)
+
+def get_blend_mesh_objects(filepath):
+    # Read straight from the block headers, None when the file can't be scanned (e.g. zstd without zstandard)
+    try:
+        object_types = blendfile.read_object_types(filepath)
+    except (OSError, blendfile.BlendFileError) as e:
+        print('Could not scan ' + filepath + ': ' + str(e))
+        return None
+    
+    return {name for name, object_type in object_types.items() if object_type == 'MESH'}
+
+def rig_trait_meshes(meshes, armature):
+    """Unparent the meshes keeping their transforms and point their armature modifiers at the clone's armature
+    
+    Works on the data directly, where parent_clear would need a selection change and a
+    depsgraph evaluation per call
+    """
+    # Read every world matrix before any parent changes
+    world_matrices = [obj.matrix_world.copy() for obj in meshes]
+    
+    for obj, matrix_world in zip(meshes, world_matrices):
+        obj.parent = None
+        obj.matrix_world = matrix_world
+        
+        armature_mod = get_armature_modifier(obj)
         
-    # Clean up unused objects          
-    for obj in objects:
-        if obj.type != 'MESH':
-            delete_object(obj)   
+        if armature_mod is not None:
+            armature_mod.object = armature
 
-def update_trait_selected(self, context):
-    # Store the base_mats for comparison checks
-    base_mats = [get_material('Head'), get_material('Suit')]
-    
-    print(self.trait_dir)
-    if Path(os.path.join(self.trait_dir, '_' + get_scene().clonex_gender)).is_dir():
-        filepath = os.path.join(self.trait_dir, '_' + get_scene().clonex_gender, '_blender')
-    
-        for file in os.listdir(filepath):
-            if file.endswith('.blend'):
-                # Append the objects from blend file              
-                if self.trait_selected:
-                    if not collection_exists(self.trait_name):
-                        # This is the first time the trait is being selected so load the files
-                        trait_collection = create_collection(self.trait_name)
-                        load_clonex_trait_files_into_collection(trait_collection, os.path.join(filepath, file))
-                                                                 
-                    else:
-                        # If the collection already exists just unhide it
-                        unhide_collection_viewport(self.trait_name)
-                        unhide_collection_render(self.trait_name)
-                else:
-                    if collection_exists(self.trait_name):
-                        hide_collection_viewport(self.trait_name)
-                        hide_collection_render(self.trait_name)
-                    
-                break
-    else:
-        # These traits are textures that need to be applied
-        filepath = ''
-        geo_objects = []  
-        geo_object = None
+# Datablock types a trait load can leave behind without users
+ORPHAN_DATA = ('objects', 'meshes', 'armatures', 'materials', 'images', 'textures', 'actions', 'node_groups', 'lights', 'curves', 'cameras')
+
+def snapshot_data_ids(orphans_only=False):
+    return {attr: {block for block in getattr(bpy.data, attr) if not orphans_only or block.users == 0} for attr in ORPHAN_DATA}
+
+def added_data_ids(before):
+    """Datablocks that are new since the snapshot_data_ids() in before"""
+    return {attr: {block for block in getattr(bpy.data, attr) if block not in before[attr]} for attr in ORPHAN_DATA}
+
+def estimate_data_bytes(attr, block):
+    # Only the bulk of the memory is counted, pixels and mesh arrays
+    if attr == 'images':
+        return block.size[0] * block.size[1] * block.channels * (4 if block.is_float else 1) if block.has_data else 0
+    elif attr == 'meshes':
+        return len(block.vertices) * 12 + len(block.edges) * 8 + len(block.loops) * 8 + len(block.polygons) * 12
+    
+    return 0
+
+def reclaim_orphan_data(exclude=None, only=None):
+    """Remove datablocks left without users, until removing them doesn't orphan anything else
+    
+    Like easybpy's delete_unused_data, but every round is a single batch_remove, anything 
+    in exclude (a snapshot_data_ids()) is left alone and with only, nothing outside of it 
+    is touched. Returns the number of datablocks removed and roughly how many bytes they held
+    """
+    removed = 0
+    freed_bytes = 0
+    
+    while True:
+        orphans = [
+            (attr, block) for attr in ORPHAN_DATA for block in getattr(bpy.data, attr) 
+            if block.users == 0 and not block.use_fake_user and block.library is None 
+            and (exclude is None or block not in exclude[attr]) 
+            and (only is None or block in only[attr])
+        ]
         
-        # These head and suit objects can have varying names, so do some fuzzy matching
-        if Path(self.trait_dir).name.startswith('Characters'):
-            geo_objects = get_objects_including('SuitGeo')
-            filepath = os.path.join(self.trait_dir, '_textures', 'suit_' + get_scene().clonex_gender)
-        elif Path(self.trait_dir).name.startswith('DNA'):
-            geo_objects = get_objects_including('HeadGeo')
-            filepath = os.path.join(self.trait_dir, '_texture')
+        if len(orphans) == 0:
+            break
+        
+        freed_bytes += sum(estimate_data_bytes(attr, block) for attr, block in orphans)
+        removed += len(orphans)
+        bpy.data.batch_remove([block for attr, block in orphans])
+    
+    return removed, freed_bytes
+
+# Bumped every time a trait is equipped, so hidden traits can be unloaded least recently equipped first
+_trait_equip_clock = 0
+_trait_equipped_at = {}
+
+def mark_trait_equipped(trait_name):
+    global _trait_equip_clock
+    
+    _trait_equip_clock += 1
+    _trait_equipped_at[trait_name] = _trait_equip_clock
+
+def get_trait_memory_budget():
+    prefs = get_addon_preferences()
+    
+    return int(prefs.trait_memory_budget_gb * 1024 ** 3) if prefs is not None else 0
+
+def estimate_collection_bytes(collection):
+    meshes = {obj.data for obj in collection.objects if obj.type == 'MESH'}
+    materials = {mat for mesh in meshes for mat in mesh.materials if mat is not None}
+    images = {node.image for mat in materials if mat.node_tree is not None for node in mat.node_tree.nodes if getattr(node, 'image', None) is not None}
+    
+    return sum(estimate_data_bytes('meshes', mesh) for mesh in meshes) + sum(estimate_data_bytes('images', image) for image in images)
+
+def unload_trait_collection(trait_name):
+    """Remove a trait's collection with everything only it was using, ticking the trait loads it again"""
+    collection = get_collection(trait_name)
+    already_orphaned = snapshot_data_ids(orphans_only=True)
+    
+    bpy.data.batch_remove(list(collection.objects) + [collection])
+    _trait_equipped_at.pop(trait_name, None)
+    
+    return reclaim_orphan_data(already_orphaned)
+
+def enforce_trait_memory_budget():
+    budget = get_trait_memory_budget()
+    
+    if budget <= 0:
+        return
+    
+    loaded = [item for item in get_scene().clonex_trait_collection if collection_exists(item.trait_name)]
+    sizes = {item.trait_name: estimate_collection_bytes(get_collection(item.trait_name)) for item in loaded}
+    total = sum(sizes.values())
+    
+    # Only hidden traits are candidates, the ones equipped longest ago go first
+    hidden = sorted((item.trait_name for item in loaded if not item.trait_selected), key=lambda name: _trait_equipped_at.get(name, 0))
+    
+    for trait_name in hidden:
+        if total <= budget:
+            break
+        
+        removed, freed_bytes = unload_trait_collection(trait_name)
+        total -= sizes[trait_name]
+        print('Unloaded {} to stay within the memory budget ({} datablocks, ~{:.1f} MB)'.format(trait_name, removed, freed_bytes / 1024 ** 2))
+
+def read_trait_library(trait_collection, filepath, link):
+    """Read a trait's objects from its .blend file without adding them to the scene
+    
+    Returns the collection, the objects asked for and every datablock the read added
+    """
+    mesh_names = get_blend_mesh_objects(filepath)
+    before = snapshot_data_ids()
+    
+    with bpy.data.libraries.load(filepath, link=link) as (data_from, data_to):
+        # Only ask for the meshes, the trait's own copy of the rig is never wanted
+        data_to.objects = [name for name in data_from.objects if mesh_names is None or name in mesh_names]
+    
+    return trait_collection, [obj for obj in data_to.objects if obj is not None], added_data_ids(before)
 
-        if len(geo_objects) > 0:
-            geo_object = geo_objects[0]
+def finish_trait_libraries(loaded, link):
+    """Link the objects read by read_trait_library into their collections and rig them in one pass
+    
+    With linked libraries only the meshes are instanced, and only the ones with an 
+    armature modifier to retarget get a library override. Only what the reads added 
+    is ever removed, the scene may have changed in between them
+    """
+    added = {attr: set().union(*(trait_added[attr] for trait_collection, trait_objects, trait_added in loaded)) for attr in ORPHAN_DATA}
+    
+    # Objects the meshes point at (their parent rig) still come along as dependencies
+    requested = {obj for trait_collection, trait_objects, trait_added in loaded for obj in trait_objects}
+    dependencies = [obj for obj in bpy.data.objects if obj in added['objects'] and obj not in requested and obj.library is None]
+    
+    objects = []
+    meshes = []
+    
+    for trait_collection, trait_objects, trait_added in loaded:
+        trait_meshes = [obj for obj in trait_objects if obj.type == 'MESH']
         
+        if link:
+            # Linked objects that aren't instanced in the scene aren't saved with the file
+            link_objects_to_collection(trait_meshes, trait_collection)
+            trait_meshes = override_linked_objects([obj for obj in trait_meshes if get_armature_modifier(obj) is not None])
+        else:
+            link_objects_to_collection(trait_objects, trait_collection)
+            objects.extend(trait_objects)
+        
+        meshes.extend(trait_meshes)
+    
+    rig_trait_meshes(meshes, get_clone_armature())
+    
+    # Clean up unused objects, the dependencies have no users left now the meshes are rigged
+    unused = [obj for obj in objects if obj.type != 'MESH'] + dependencies
+    
+    if len(unused) > 0:
+        bpy.data.batch_remove(unused)
+    
+    # The removed rigs leave their armature data, actions, materials and images behind
+    removed, freed_bytes = reclaim_orphan_data(only=added)
+    
+    if removed > 0:
+        print('Freed {} unused datablocks (~{:.1f} MB)'.format(removed, freed_bytes / 1024 ** 2))
+    
+    # One depsgraph update for the whole batch
+    bpy.context.view_layer.update()
+
+def load_clonex_trait_files_into_collections(trait_files):
+    """Load (trait_collection, filepath) pairs and rig all of their objects in one pass"""
+    link = use_linked_libraries()
+    
+    # Read every library first, nothing is linked into the scene until they are all in
+    loaded = [read_trait_library(trait_collection, filepath, link) for trait_collection, filepath in trait_files]
+    finish_trait_libraries(loaded, link)
+
+def load_clonex_trait_files_into_collection(trait_collection, filepath):
+    load_clonex_trait_files_into_collections([(trait_collection, filepath)])
+
+# Set while trait items are added or restored in bulk, so ticking their checkboxes
+# doesn't load anything
+_trait_updates_suspended = False
+
+def apply_texture_trait(item, record, report_sync=True):
+    # These traits are textures that need to be applied
+    texture_files = record.texture_files.get(get_scene().clonex_gender, [])
+    geo_object = None
+    
+    # The loader registered the head and suit objects, see register_clone_geometry
+    if record.folder_name.startswith('Characters'):
+        geo_object, base_mat, dna_mat = get_clone_geometry('suit')
+    elif record.folder_name.startswith('DNA'):
+        geo_object, base_mat, dna_mat = get_clone_geometry('head')
+
+    if geo_object is not None:
         geo_mat = get_material_from_object(geo_object)
+        
+        if item.trait_selected and geo_mat == base_mat:
+            apply_dna_textures_to_object(texture_files, geo_object)
+        elif not item.trait_selected and geo_mat != base_mat:       
+            remove_dna_textures_from_object(geo_object)
+        elif report_sync:
+            print('Material state is out of sync, no action taken')
 
-        if geo_object is not None:
-            if self.trait_selected and geo_mat in base_mats:
-                apply_dna_textures_to_object(filepath, geo_object)
-            elif not self.trait_selected and geo_mat not in base_mats:       
-                remove_dna_textures_from_object(geo_object)
+def update_trait_selected(self, context):
+    # An import in progress owns the checkboxes, its equip stage applies them
+    if _trait_updates_suspended or get_scene().clonex_defer_trait_updates or bpy.context.window_manager.clonex_import_stage != '':
+        return
+    
+    stop_readahead()
+    
+    gender = get_scene().clonex_gender
+    record = get_trait_record(self)
+    
+    if record is None:
+        print('No files found for ' + self.trait_name)
+        return
+    
+    # Archives are only extracted the first time their trait is equipped
+    if self.trait_selected and self.trait_archive != '':
+        extract_trait_archives([(self.trait_archive, self.trait_dir)], gender)
+    
+    if gender in record.blend_files:
+        # Append the objects from blend file              
+        if self.trait_selected:
+            if not collection_exists(self.trait_name):
+                # This is the first time the trait is being selected (or it was unloaded) so load the files
+                trait_collection = create_collection(self.trait_name)
+                load_clonex_trait_files_into_collection(trait_collection, record.blend_files[gender])
+                                                         
             else:
-                print('Material state is out of sync, no action taken')
+                # If the collection already exists just unhide it
+                unhide_collection_viewport(self.trait_name)
+                unhide_collection_render(self.trait_name)
+            
+            mark_trait_equipped(self.trait_name)
+        else:
+            if collection_exists(self.trait_name):
+                hide_collection_viewport(self.trait_name)
+                hide_collection_render(self.trait_name)
+        
+        enforce_trait_memory_budget()
+    else:
+        apply_texture_trait(self, record)
+    
+    start_readahead()
+
+def apply_trait_selection(items=None):
+    """Bring the scene in line with the trait checkboxes in one batch
+    
+    Works out every trait to equip or hide up front, extracts the zipped ones in one
+    parallel batch and loads all of the new .blend files together, instead of paying
+    for a load and a rig pass per checkbox. Returns the number of traits loaded
+    """
+    steps = iter_trait_selection(items)
+    
+    try:
+        while True:
+            next(steps)
+    except StopIteration as done:
+        return done.value
 
-def format_trait_display_name(folder_name):
-    folder_name_tokenized = folder_name.split('-')
-    trait_name = ''
+def iter_trait_selection(items=None):
+    """apply_trait_selection one .blend file read at a time, for callers that run it from a timer
+    
+    Yields (trait_name, loaded, total) after each file is read. The step after the last 
+    one links, rigs and cleans up all of them at once
+    """
+    scene = get_scene()
+    gender = scene.clonex_gender
+    stop_readahead()
+    
+    if items is None:
+        items = list(scene.clonex_trait_collection)
     
-    for idx, token in enumerate(folder_name_tokenized):
-        if idx == 0:
-            trait_name += token + ' -'
+    records = [(item, get_trait_record(item)) for item in items]
+    records = [(item, record) for item, record in records if record is not None]
+    to_load = [(item, record) for item, record in records 
+        if item.trait_selected and gender in record.blend_files and not collection_exists(item.trait_name)]
+    to_texture = [(item, record) for item, record in records if gender not in record.blend_files]
+    
+    archives = [(item.trait_archive, item.trait_dir) for item, record in to_load + to_texture 
+        if item.trait_selected and item.trait_archive != '']
+    
+    if len(archives) > 0:
+        extract_trait_archives(archives, gender)
+    
+    link = use_linked_libraries()
+    loaded = []
+    
+    for item, record in to_load:
+        loaded.append(read_trait_library(create_collection(item.trait_name), record.blend_files[gender], link))
+        yield item.trait_name, len(loaded), len(to_load)
+    
+    finish_trait_libraries(loaded, link)
+    
+    for item, record in records:
+        if gender not in record.blend_files or not collection_exists(item.trait_name):
             continue
         
-        if (token != 'Combined'):
-            trait_description_tokens = token.split('_')
+        if item.trait_selected:
+            unhide_collection_viewport(item.trait_name)
+            unhide_collection_render(item.trait_name)
+            mark_trait_equipped(item.trait_name)
+        else:
+            hide_collection_viewport(item.trait_name)
+            hide_collection_render(item.trait_name)
+    
+    # Unticked texture traits that were never applied are expected here, not out of sync
+    for item, record in to_texture:
+        apply_texture_trait(item, record, report_sync=False)
+    
+    enforce_trait_memory_budget()
+    start_readahead()
+    
+    return len(to_load)
+
+def set_trait_items(items, selected=None, clear=True):
+    """Replace (or with clear=False, extend) the trait checkboxes without triggering update_trait_selected"""
+    global _trait_updates_suspended
+    
+    _trait_updates_suspended = True
+    
+    try:
+        if clear:
+            get_scene().clonex_trait_collection.clear()
+        
+        for trait_dir, trait_archive, trait_name, trait_selected in items:
+            item = get_scene().clonex_trait_collection.add()
+            item.trait_dir = trait_dir
+            item.trait_archive = trait_archive
+            item.trait_name = trait_name
+            item.trait_selected = trait_selected if selected is None else selected
+    finally:
+        _trait_updates_suspended = False
+
+# Seconds between polls of the CloneX folder while it is being watched
+WATCH_INTERVAL = 2.0
+
+# Zips seen on the last poll that aren't in the index yet, and extractions still running
+_watch_state = {'dir_mtime': None, 'candidates': {}, 'pending': {}}
+_watch_executor = None
+
+def ingest_new_trait(directory, folder_name, archive):
+    global _watch_executor
+    
+    trait_index = get_trait_index(directory)
+    record = index.read_trait_record(folder_name, get_trait_dir(folder_name, archive), archive)
+    trait_index[folder_name] = record
+    index.write_index_cache(directory, trait_index)
+    
+    if not record.has_gender(get_scene().clonex_gender):
+        return
+    
+    if _watch_executor is None:
+        _watch_executor = ThreadPoolExecutor(max_workers=1)
+    
+    # Extract off the main thread, the checkbox is added once it's done
+    stop_readahead()
+    run = start_trait_extraction([(archive, record.trait_dir)], get_scene().clonex_gender)
+    _watch_state['pending'][folder_name] = (_watch_executor.submit(run), record)
+
+def poll_clonex_folder(directory):
+    trait_index = get_trait_index(directory)
+    pending = _watch_state['pending']
+    
+    # Register the traits whose extraction has finished
+    for folder_name, (future, record) in list(pending.items()):
+        if future.done():
+            del pending[folder_name]
+            
+            try:
+                future.result()
+            except Exception as e:
+                # Forget the trait and rescan the folder, so it is picked up and extracted again
+                print('Could not extract {}: {}'.format(record.display_name, e))
+                trait_index.pop(folder_name, None)
+                index.write_index_cache(directory, trait_index)
+                _watch_state['dir_mtime'] = None
+                continue
             
-            for desc_token in trait_description_tokens:
-                trait_name += ' ' + desc_token.capitalize()
+            # Only this trait is added, everything already loaded is left alone
+            if all(get_trait_folder_name(item) != folder_name for item in get_scene().clonex_trait_collection):
+                set_trait_items([(record.trait_dir, record.archive, record.display_name, False)], clear=False)
+                print('Added new trait ' + record.display_name)
+    
+    # Nothing can have been added if the folder itself hasn't changed
+    dir_mtime = os.stat(directory).st_mtime_ns
+    
+    if dir_mtime == _watch_state['dir_mtime'] and len(_watch_state['candidates']) == 0:
+        return
+    
+    _watch_state['dir_mtime'] = dir_mtime
+    seen = {}
+    
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.zip'):
+                continue
+            
+            folder_name = entry.name[:-len('.zip')]
+            
+            if folder_name in trait_index or folder_name in pending or not index.is_trait_folder(folder_name):
+                continue
+            
+            st = entry.stat()
+            seen[folder_name] = (entry.path, st.st_size, st.st_mtime_ns)
+    
+    candidates = {}
+    
+    for folder_name, stamp in seen.items():
+        # The zip may still be downloading, wait until it stops changing between two polls
+        if _watch_state['candidates'].get(folder_name) != stamp:
+            candidates[folder_name] = stamp
+            continue
+        
+        try:
+            ingest_new_trait(directory, folder_name, stamp[0])
+        except zipfile.BadZipFile:
+            candidates[folder_name] = stamp
+    
+    _watch_state['candidates'] = candidates
+
+def watch_clonex_folder():
+    scene = bpy.context.scene
+    
+    # Returning None unregisters the timer
+    if scene is None or not scene.clonex_watch_folder or scene.clonex_home_dir == '':
+        return None
+    
+    try:
+        poll_clonex_folder(scene.clonex_home_dir)
+    except Exception as e:
+        print('Watching the CloneX folder failed: ' + str(e))
+    
+    return WATCH_INTERVAL
+
+def start_watching_folder():
+    _watch_state['dir_mtime'] = None
+    _watch_state['candidates'] = {}
+    
+    if not bpy.app.timers.is_registered(watch_clonex_folder):
+        bpy.app.timers.register(watch_clonex_folder, first_interval=WATCH_INTERVAL)
+
+def stop_watching_folder():
+    if bpy.app.timers.is_registered(watch_clonex_folder):
+        bpy.app.timers.unregister(watch_clonex_folder)
+
+def update_watch_folder(self, context):
+    if self.clonex_watch_folder:
+        start_watching_folder()
+    else:
+        stop_watching_folder()
+
+@persistent
+def clonex_load_post(dummy):
+    stop_readahead()
+    
+    # The images belonged to the previous file, the new one's are found through their hash property
+    _images_by_hash.clear()
+    _proxy_jobs.clear()
+    restore_extracted_archives()
+    refill_cached_images()
+    
+    # Timers don't survive loading a file, so pick the watcher back up
+    if get_scene().clonex_watch_folder:
+        start_watching_folder()
+    else:
+        stop_watching_folder()
 
-    return trait_name 
+def set_import_progress(context, stage, fraction):
+    wm = context.window_manager
+    wm.clonex_import_stage = stage
+    wm.clonex_import_progress = fraction * 100
+    wm.progress_update(fraction)
     
+    for area in context.screen.areas:
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
+
 class BaseCloneSelectOperator(Operator):
     """Use the file browser to select your base clone .blend file"""
     
@@ -247,72 +1377,363 @@ class BaseCloneSelectOperator(Operator):
     directory: StringProperty(name="Directory", options={'HIDDEN'})
     filter_folder: BoolProperty(default=False, options={'HIDDEN'})
     
+    # Import stages in the order they run, each modal timer tick does one slice of work
+    STAGES = ('EXTRACT', 'BASE_CLONE', 'REGISTER', 'EQUIP', 'FINISH')
+    STAGE_LABELS = {
+        'EXTRACT': 'Extracting archives',
+        'BASE_CLONE': 'Loading base clone',
+        'REGISTER': 'Registering traits',
+        'EQUIP': 'Equipping traits',
+        'FINISH': 'Setting up viewport',
+    }
+    # Where each stage starts on the progress bar
+    STAGE_PROGRESS = {'EXTRACT': 0.0, 'BASE_CLONE': 0.5, 'REGISTER': 0.6, 'EQUIP': 0.65, 'FINISH': 0.95}
+    # Datablock types a stage can add, a cancelled import removes the ones it added
+    IMPORT_DATA = ('collections', 'libraries') + ORPHAN_DATA
+    
     def execute(self, context):                  
-        # Delete the default cube if it exists
-        if get_object("Cube") is not None:
-            delete_object("Cube")
+        stop_readahead()
+        
+        # The default cube is taken out of the scene with the base clone and only deleted 
+        # once the import finishes, so a cancelled import can put it back
+        self._cube = None
         
         # Load the base clone objects
-        base_clone_path = None
-        base_clone_filepath = None
-
-        for path in Path(self.directory).iterdir():
-            # Check to see if the directory already exists before unzipping
-            if path.is_dir():
-                if path.name.startswith('Characters-character'):
-                    base_clone_path = path.resolve()
-            else:
-                if path.suffix == '.zip' and not Path(os.path.join(self.directory, path.stem)).is_dir():
-                    # Unzip the file into a directoy with a matching name
-                    with zipfile.ZipFile(path) as zip_ref:
-                        zip_ref.extractall(os.path.join(self.directory, path.stem))
-            
-                    # Grab a reference to the base clone path
-                    if path.stem.startswith('Characters-character'):
-                        base_clone_path = os.path.join(self.directory, path.stem)
-
-        if base_clone_path is not None:
-            base_clone_path = os.path.join(base_clone_path, '_' + get_scene().clonex_gender, '_blender')
-            base_clone_file = os.listdir(base_clone_path)[0]
-            base_clone_filepath = os.path.join(base_clone_path, base_clone_file)
-
-            with bpy.data.libraries.load(base_clone_filepath) as (data_from, data_to):
-                data_to.objects = data_from.objects
-                
-        if not collection_exists("Character"):
-            create_collection("Character")
-            link_objects_to_collection(data_to.objects, get_collection("Character"))    
+        gender = get_scene().clonex_gender
+        
+        # One pass over the folder, zipped traits are indexed from their central directory
+        trait_index = get_trait_index(self.directory, rebuild=True)
+        self._base_clone = index.find_base_clone(trait_index)
+        self._traits = [r for r in trait_index.values() if index.is_trait_folder(r.folder_name) and r.has_gender(gender)]
+        archives = []
+        
+        if self._base_clone is not None and self._base_clone.archive != '':
+            archives.append((self._base_clone.archive, self._base_clone.trait_dir))
+        
+        # Traits that are equipped straight away are extracted up front in one parallel batch, 
+        # the rest stay zipped until their checkbox is ticked
+        for record in self._traits:
+            if record.archive != '' and is_trait_equipped_by_default(record.display_name):
+                archives.append((record.archive, record.trait_dir))
+        
+        # The same clone with the same traits was assembled before, load the result in one go. 
+        # The archives are still extracted (only verified when they already are) for the texture files
+        self._snapshot_cache = get_snapshot_cache()
+        self._snapshot = None
+        self._snapshot_collections = []
+        # Only a clone this import builds from scratch is written as a snapshot, never one 
+        # that reuses collections already in the scene (another gender, the user's edits)
+        self._assembled = False
+        
+        if self._snapshot_cache is not None and self._base_clone is not None and gender in self._base_clone.blend_files:
+            equipped = [r for r in self._traits if is_trait_equipped_by_default(r.display_name)]
+            self._snapshot_key = get_snapshot_key(self._base_clone, equipped, gender)
+            self._snapshot_collections = ["Character"] + [r.display_name for r in equipped if gender in r.blend_files]
+            self._assembled = not any(collection_exists(name) for name in self._snapshot_collections)
             
-        get_scene().clonex_trait_collection.clear()
+            if self._assembled:
+                self._snapshot = self._snapshot_cache.get(self._snapshot_key)
+        
+        # Remember what the scene looked like so ESC can put it back
+        scene = get_scene()
+        self._previous_items = [(i.trait_dir, i.trait_archive, i.trait_name, i.trait_selected) for i in scene.clonex_trait_collection]
+        self._previous_state = (scene.clonex_home_dir, scene.clonex_base_archive, scene.clonex_loaded)
+        # Only what the import's own stages create is removed, never what the user adds meanwhile
+        self._created_ids = {attr: set() for attr in self.IMPORT_DATA}
+        
+        # Extract all of the archives in parallel on a background thread and poll it from the timer
+        self._progress = extract.ExtractionProgress()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._extraction = self._executor.submit(start_trait_extraction(archives, gender, self._progress))
+        self._stage = 'EXTRACT'
+        self._equip = None
+        
+        wm = context.window_manager
+        wm.progress_begin(0, 1)
+        set_import_progress(context, self.STAGE_LABELS[self._stage], 0)
+        self._timer = wm.event_timer_add(0.05, window=context.window)
+        wm.modal_handler_add(self)
+        
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self.rollback(context)
+            self.finish(context)
+            self.report({'INFO'}, 'CloneX import cancelled')
+            return {'CANCELLED'}
+        
+        if event.type != 'TIMER':
+            # Keep the viewport and the rest of the UI responsive while importing
+            return {'PASS_THROUGH'}
+        
+        before = {attr: set(getattr(bpy.data, attr)) for attr in self.IMPORT_DATA}
+        
+        try:
+            self.step(context)
+        except Exception as e:
+            self.record_created_ids(before)
+            self.rollback(context)
+            self.finish(context)
+            self.report({'ERROR'}, 'CloneX import failed: ' + str(e))
+            return {'CANCELLED'}
+        
+        self.record_created_ids(before)
+        
+        if self._stage is None:
+            self.finish(context)
+            return {'FINISHED'}
+        
+        return {'PASS_THROUGH'}
+    
+    def record_created_ids(self, before):
+        for attr in self.IMPORT_DATA:
+            self._created_ids[attr].update(block for block in getattr(bpy.data, attr) if block not in before[attr])
+    
+    def next_stage(self):
+        idx = self.STAGES.index(self._stage) + 1
+        self._stage = self.STAGES[idx] if idx < len(self.STAGES) else None
+    
+    def step(self, context):
+        gender = get_scene().clonex_gender
         
-        for i in range(len([f for f in os.listdir(self.directory) if os.path.isdir(os.path.join(self.directory, f))])):
-            folder_name = [f for f in os.listdir(self.directory) if os.path.isdir(os.path.join(self.directory, f))][i]
+        if self._stage == 'EXTRACT':
+            if not self._extraction.done():
+                set_import_progress(context, self.STAGE_LABELS['EXTRACT'], 0.5 * self._progress.fraction())
+                return
             
-            # Don't create a checkbox for the base clone file
-            if 'Characters-character' in folder_name or not folder_name.endswith('Combined'):
-                continue
-
-            trait_display_name = format_trait_display_name(folder_name)
-                    
-            item = get_scene().clonex_trait_collection.add()
-            item.trait_dir = os.path.join(self.directory, folder_name)
-            item.trait_name = trait_display_name
+            # Re-raises anything that went wrong on the extraction thread
+            self._extraction.result()
+        elif self._stage == 'BASE_CLONE':
+            base_clone = self._base_clone
+            cube = get_object("Cube")
+            
+            if cube is not None:
+                self._cube = (cube, list(cube.users_collection))
+                
+                for col in self._cube[1]:
+                    col.objects.unlink(cube)
+            
+            if self._snapshot is not None:
+                try:
+                    load_clone_snapshot(self._snapshot, self._snapshot_collections)
+                except Exception:
+                    # Assembled again next time
+                    self._snapshot_cache.discard(self._snapshot_key)
+                    raise
+            elif base_clone is not None and gender in base_clone.blend_files and not collection_exists("Character"):
+                load_base_clone_into_collection(create_collection("Character"), base_clone.blend_files[gender])
+        elif self._stage == 'REGISTER':
+            get_scene().clonex_home_dir = self.directory
+            get_scene().clonex_base_archive = self._base_clone.archive if self._base_clone is not None else ''
             
-            # Only equip one of the bottoms initially
-            if 'Bottoms - Tech' in trait_display_name or 'Bottoms - Leggings' in trait_display_name:
-                item.trait_selected = False
-            else: 
-                item.trait_selected = True
+            # Checkboxes are ticked without their callbacks, the equip stage loads them all at once
+            set_trait_items([(r.trait_dir, r.archive, r.display_name, is_trait_equipped_by_default(r.display_name)) for r in self._traits])
+        elif self._stage == 'EQUIP':
+            if self._equip is None:
+                self._equip = iter_trait_selection()
+            
+            # One trait's file per tick, the tick after the last one rigs them all
+            try:
+                trait_name, loaded, total = next(self._equip)
+            except StopIteration:
+                self._equip = None
+            else:
+                start, end = self.STAGE_PROGRESS['EQUIP'], self.STAGE_PROGRESS['FINISH']
+                label = '{} ({}/{}: {})'.format(self.STAGE_LABELS['EQUIP'], loaded, total, trait_name)
+                set_import_progress(context, label, start + (end - start) * loaded / total)
+                return
+        elif self._stage == 'FINISH':
+            if self._snapshot is None and self._assembled:
+                write_clone_snapshot(self._snapshot_cache, self._snapshot_key, self._snapshot_collections)
+            
+            if self._cube is not None:
+                bpy.data.batch_remove([self._cube[0]])
+                self._cube = None
+            
+            get_scene().clonex_loaded = True
+            setup_viewport(context)
+            start_readahead()
         
-        get_scene().clonex_loaded = True
-        setup_viewport(context)
+        self.next_stage()
         
-        return {'FINISHED'}
+        if self._stage is not None:
+            set_import_progress(context, self.STAGE_LABELS[self._stage], self.STAGE_PROGRESS[self._stage])
+    
+    def rollback(self, context):
+        # Stop the extraction first, anything it finished is kept in its manifest for next time
+        self._progress.cancel()
+        self._executor.shutdown(wait=True)
+        
+        if self._equip is not None:
+            self._equip.close()
+        
+        # Remove everything this import added to the file. Going through bpy.data skips 
+        # anything the user deleted in the meantime
+        added = [block for attr in self.IMPORT_DATA for block in getattr(bpy.data, attr) if block in self._created_ids[attr]]
+        
+        if len(added) > 0:
+            bpy.data.batch_remove(added)
+        
+        if self._cube is not None:
+            cube, collections = self._cube
+            
+            for col in collections:
+                col.objects.link(cube)
+        
+        scene = get_scene()
+        set_trait_items(self._previous_items)
+        scene.clonex_home_dir, scene.clonex_base_archive, scene.clonex_loaded = self._previous_state
+    
+    def finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        wm.clonex_import_stage = ''
+        wm.clonex_import_progress = 0
+        self._executor.shutdown(wait=False)
+        
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
 
     def invoke(self, context, event):
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
 
+class ApplyTraitSelectionOperator(Operator):
+    """Equip and hide traits to match the checkboxes in one batch"""
+    
+    bl_idname = "clonex.apply_trait_selection"
+    bl_label = "Apply Selection"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    @classmethod
+    def poll(cls, context):
+        return context.scene.clonex_loaded and context.window_manager.clonex_import_stage == ''
+    
+    def execute(self, context):
+        loaded = apply_trait_selection()
+        self.report({'INFO'}, 'Loaded ' + str(loaded) + ' traits')
+        
+        return {'FINISHED'}
+
+class EasyCloneXPreferences(AddonPreferences):
+    bl_idname = __package__
+    
+    extract_workers: IntProperty(
+        name='Extraction Workers', 
+        description='Number of threads used to unzip CloneX archives (0 picks a value based on the CPU count)', 
+        default=0, 
+        min=0, 
+        max=64
+    )
+    
+    use_extraction_cache: BoolProperty(
+        name='Use Extraction Cache', 
+        description='Extract archives into a shared cache that every project can reuse instead of next to the zip files', 
+        default=True
+    )
+    
+    cache_dir: StringProperty(
+        name='Cache Directory', 
+        description='Where extracted archives are cached (leave empty to use the Blender user data folder)', 
+        default='', 
+        subtype='DIR_PATH'
+    )
+    
+    link_trait_libraries: BoolProperty(
+        name='Link Trait Libraries', 
+        description='Link clone and trait meshes from the extracted .blend files instead of appending copies of them. Only objects that have to be edited get a library override', 
+        default=False
+    )
+    
+    trait_memory_budget_gb: FloatProperty(
+        name='Trait Memory Budget (GB)', 
+        description='Once loaded traits take more memory than this, hidden traits are unloaded, least recently equipped first. They load again when ticked. 0 keeps every trait loaded', 
+        default=4.0, 
+        min=0.0
+    )
+    
+    readahead_budget_mb: IntProperty(
+        name='Read-Ahead Budget (MB)', 
+        description='How much of the traits that are not loaded yet is read ahead in the background, so equipping them doesn\'t wait on a cold disk or network share. 0 turns read-ahead off', 
+        default=2048, 
+        min=0
+    )
+    
+    use_snapshot_cache: BoolProperty(
+        name='Cache Assembled Clones', 
+        description='Save each imported clone as a .blend snapshot, so opening the same clone with the same traits again is a single load. Not used with linked libraries', 
+        default=True
+    )
+    
+    snapshot_cache_gb: FloatProperty(
+        name='Snapshot Cache Size (GB)', 
+        description='Least recently used snapshots are removed once they take more than this', 
+        default=5.0, 
+        min=0.5
+    )
+    
+    use_pixel_cache: BoolProperty(
+        name='Cache Decoded Textures', 
+        description='Store the decoded pixels of DNA textures next to the trait index and memory map them on later loads instead of decoding the PNG and JPG files again. Takes more disk space than the textures themselves', 
+        default=False
+    )
+    
+    pixel_cache_format: EnumProperty(
+        name='Pixel Format', 
+        description='How decoded pixels are stored', 
+        items=[
+            ('UINT8', '8-bit', 'A byte per channel, a quarter of the size of float'), 
+            ('FLOAT', 'Float', '4 bytes per channel, copied into Blender without converting'), 
+        ], 
+        default='UINT8'
+    )
+    
+    proxy_size: EnumProperty(
+        name='Texture Proxy Size', 
+        description='Longest side of the viewport copies of DNA and suit textures', 
+        items=[
+            ('512', '512', ''), 
+            ('1024', '1K', ''), 
+        ], 
+        default='1024'
+    )
+    
+    cache_size_gb: FloatProperty(
+        name='Cache Size (GB)', 
+        description='Least recently used archives are removed from the cache once it grows past this size', 
+        default=20.0, 
+        min=1.0
+    )
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, 'extract_workers')
+        layout.prop(self, 'link_trait_libraries')
+        layout.prop(self, 'trait_memory_budget_gb')
+        layout.prop(self, 'readahead_budget_mb')
+        layout.prop(self, 'use_extraction_cache')
+        
+        row_cache = layout.row()
+        row_cache.enabled = self.use_extraction_cache
+        row_cache.prop(self, 'cache_dir')
+        row_cache.prop(self, 'cache_size_gb')
+        
+        layout.prop(self, 'proxy_size')
+        layout.prop(self, 'use_pixel_cache')
+        
+        row_pixels = layout.row()
+        row_pixels.enabled = self.use_pixel_cache
+        row_pixels.prop(self, 'pixel_cache_format')
+        
+        layout.prop(self, 'use_snapshot_cache')
+        
+        row_snapshot = layout.row()
+        row_snapshot.enabled = self.use_snapshot_cache and not self.link_trait_libraries
+        row_snapshot.prop(self, 'snapshot_cache_gb')
+
 class EasyCloneXPanel(Panel):
     bl_label = 'Easy CloneX'
     bl_idname = 'OBJECT_PT_easy_clonex'
@@ -348,11 +1769,36 @@ class EasyCloneXPanel(Panel):
         row_button.active = True
         row_button.operator(BaseCloneSelectOperator.bl_idname, text='Open CloneX 3D Files', depress=True, emboss=True, icon='FILE_FOLDER')
         
+        # Progress of an import that is still running
+        wm = context.window_manager
+        
+        if wm.clonex_import_stage != '':
+            row_button.enabled = False
+            
+            col_progress = layout.column()
+            col_progress.label(text=wm.clonex_import_stage + '...')
+            
+            row_progress = col_progress.row()
+            row_progress.enabled = False
+            row_progress.prop(wm, 'clonex_import_progress', text='', slider=True)
+            
+            col_progress.label(text='Press ESC to cancel', icon='CANCEL')
+        
         if get_scene().clonex_loaded == True:
             layout.separator(factor=1.0)
             
             row_trait_heading = layout.row()
             row_trait_heading.label(text='Select Traits')
+            row_trait_heading.prop(get_scene(), 'clonex_watch_folder', text='Watch Folder', icon='FILE_REFRESH')
+            
+            row_apply = layout.row(align=True)
+            row_apply.prop(get_scene(), 'clonex_defer_trait_updates', text='Apply Selection Manually')
+            
+            if get_scene().clonex_defer_trait_updates:
+                row_apply.operator(ApplyTraitSelectionOperator.bl_idname, text='Apply', icon='CHECKMARK')
+            
+            row_proxies = layout.row()
+            row_proxies.prop(get_scene(), 'clonex_use_texture_proxies', text='Viewport Texture Proxies', icon='TEXTURE')
             
             # Column for displaying Traits with checkboxes
             col_traits = layout.box()
@@ -375,7 +1821,16 @@ class EasyCloneXPanel(Panel):
                     expand=True
                 )
         
+class CloneXGeometryPropertyGroup(PropertyGroup):
+    head_object: PointerProperty(name='Head Object', type=bpy.types.Object)
+    head_material: PointerProperty(name='Head Material', type=bpy.types.Material)
+    head_dna_material: PointerProperty(name='Head DNA Material', type=bpy.types.Material)
+    suit_object: PointerProperty(name='Suit Object', type=bpy.types.Object)
+    suit_material: PointerProperty(name='Suit Material', type=bpy.types.Material)
+    suit_dna_material: PointerProperty(name='Suit DNA Material', type=bpy.types.Material)
+
 class CloneXTraitPropertyGroup(PropertyGroup):
     trait_dir: bpy.props.StringProperty(name='Trait Directory', description='', default='', subtype='NONE', maxlen=0)
+    trait_archive: bpy.props.StringProperty(name='Trait Archive', description='Zip the trait is extracted from when it is first equipped', default='', subtype='NONE', maxlen=0)
     trait_name: bpy.props.StringProperty(name='Trait Name', description='', default='', subtype='NONE', maxlen=0)
     trait_selected: bpy.props.BoolProperty(name='Trait Selected', description='', default=False, update=update_trait_selected) 
\ No newline at end of file
@@ -0,0 +1,261 @@
+"""Time the add-on's ingest stages against a synthetic CloneX folder
+
+    python tools/benchmark.py FIXTURE_DIR --output report.json
+    blender -b --factory-startup --python tools/benchmark.py -- FIXTURE_DIR --output report.json
+
+FIXTURE_DIR is one clone folder written by generate_fixtures.py. Outside of
+Blender a stand-in bpy module is used, which reads every file it is asked to
+load but decodes nothing, so only compare reports produced the same way.
+"""
+import os, sys, json, time, shutil, platform, argparse, tempfile, contextlib, statistics, importlib.util
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(TOOLS_DIR)
+
+try:
+    import bpy
+    USING_STANDIN = False
+except ImportError:
+    sys.path.insert(0, os.path.join(TOOLS_DIR, 'bpy_standin'))
+    import bpy
+    USING_STANDIN = True
+
+def import_addon():
+    # The add-on folder name isn't a valid module name, so load it under a fixed one
+    spec = importlib.util.spec_from_file_location(
+        'easy_clonex', os.path.join(ADDON_DIR, '__init__.py'), submodule_search_locations=[ADDON_DIR]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['easy_clonex'] = module
+    spec.loader.exec_module(module)
+    
+    try:
+        module.register()
+    except ValueError:
+        # Already registered by an installed copy of the add-on
+        pass
+    
+    return module
+
+def reset_file():
+    if USING_STANDIN:
+        bpy.reset()
+    else:
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+def list_archives(fixture_dir):
+    return sorted(os.path.join(fixture_dir, f) for f in os.listdir(fixture_dir) if f.endswith('.zip'))
+
+def rig_with_ops(eca, meshes, armature):
+    # The rigging loop the add-on used before rig_trait_meshes, kept for comparison
+    for obj in meshes:
+        eca.select_only(obj)
+        bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
+        
+        armature_mod = eca.get_armature_modifier(obj)
+        
+        if armature_mod is not None:
+            armature_mod.object = armature
+
+def rig_with_data(eca, meshes, armature):
+    eca.rig_trait_meshes(meshes, armature)
+    bpy.context.view_layer.update()
+
+class Benchmark:
+    def __init__(self, args):
+        self.args = args
+        self.fixture_dir = os.path.abspath(args.fixture_dir)
+        self.results = {}
+        self.work_dir = tempfile.mkdtemp(prefix='easy_clonex_bench_')
+        self.extract_dir = os.path.join(self.work_dir, 'extracted')
+        
+        self.addon = import_addon()
+        self.extract = sys.modules['easy_clonex.clonex_io.extract']
+        self.index = sys.modules['easy_clonex.clonex_io.index']
+        self.eca = sys.modules['easy_clonex.easy_clonex_addon']
+        
+        if args.link:
+            # Stands in for the add-on preference, which isn't there when loaded from a script
+            self.eca.use_linked_libraries = lambda: True
+    
+    def record(self, stage, seconds, **extra):
+        entry = self.results.setdefault(stage, {'runs': []})
+        entry['runs'].append(round(seconds, 6))
+        entry.update(extra)
+    
+    def timed(self, stage, fn, **extra):
+        start = time.perf_counter()
+        result = fn()
+        self.record(stage, time.perf_counter() - start, **extra)
+        
+        return result
+    
+    def trait_dir_for(self, folder_name, archive):
+        return os.path.join(self.extract_dir, folder_name)
+    
+    def run_extraction(self):
+        archives = list_archives(self.fixture_dir)
+        
+        for workers in self.args.workers:
+            dest = os.path.join(self.work_dir, 'extract_{}'.format(workers))
+            pairs = [(a, os.path.join(dest, os.path.splitext(os.path.basename(a))[0])) for a in archives]
+            
+            members = self.timed(
+                'extract[workers={}]'.format(workers), 
+                lambda: self.extract.extract_archives(pairs, self.args.gender, workers)
+            )
+            self.results['extract[workers={}]'.format(workers)]['members'] = members
+            shutil.rmtree(dest)
+        
+        # Leave one extracted copy behind for the loading stages
+        pairs = [(a, self.trait_dir_for(os.path.splitext(os.path.basename(a))[0], a)) for a in archives]
+        self.extract.extract_archives(pairs, self.args.gender)
+    
+    def run_indexing(self):
+        self.timed('index[cold]', lambda: self.index.build_trait_index(self.fixture_dir, self.trait_dir_for, use_cache=False))
+        
+        # The first cached build writes the sidecar, the second one is the warm path
+        sidecar = os.path.join(self.fixture_dir, self.index.INDEX_CACHE_NAME)
+        self.index.build_trait_index(self.fixture_dir, self.trait_dir_for)
+        trait_index = self.timed('index[warm]', lambda: self.index.build_trait_index(self.fixture_dir, self.trait_dir_for))
+        os.remove(sidecar)
+        
+        return trait_index
+    
+    def run_loading(self, trait_index):
+        gender = self.args.gender
+        eca = self.eca
+        
+        reset_file()
+        bpy.context.scene.clonex_gender = gender
+        base_clone = self.index.find_base_clone(trait_index)
+        
+        def load_base_clone():
+            eca.load_base_clone_into_collection(eca.create_collection('Character'), base_clone.blend_files[gender])
+        
+        self.timed('load[base_clone]', load_base_clone)
+        
+        def load_traits():
+            for record in trait_index.values():
+                if self.index.is_trait_folder(record.folder_name) and gender in record.blend_files:
+                    trait_collection = eca.create_collection(record.display_name)
+                    eca.load_clonex_trait_files_into_collection(trait_collection, record.blend_files[gender])
+        
+        trait_count = sum(1 for r in trait_index.values() if gender in r.blend_files) - 1
+        self.timed('load[traits]', load_traits, traits=trait_count)
+        
+        # The same traits again from a fresh file, through the single batch used by Apply Selection
+        reset_file()
+        load_base_clone()
+        
+        def load_traits_batch():
+            eca.load_clonex_trait_files_into_collections([
+                (eca.create_collection(record.display_name), record.blend_files[gender]) 
+                for record in trait_index.values() 
+                if self.index.is_trait_folder(record.folder_name) and gender in record.blend_files
+            ])
+        
+        self.timed('load[traits,batch]', load_traits_batch, traits=trait_count)
+        
+        # Mesh data that would be written into the saved file, linked meshes stay in their libraries
+        self.results['load[traits,batch]']['local_meshes'] = sum(1 for mesh in bpy.data.meshes if mesh.library is None)
+        
+        # Rigging on its own, over the same freshly appended trait meshes each time
+        for stage, rig in (('rig[ops]', rig_with_ops), ('rig[data]', rig_with_data)):
+            reset_file()
+            load_base_clone()
+            meshes = []
+            
+            for record in trait_index.values():
+                if self.index.is_trait_folder(record.folder_name) and gender in record.blend_files:
+                    with bpy.data.libraries.load(record.blend_files[gender]) as (data_from, data_to):
+                        data_to.objects = data_from.objects
+                    
+                    eca.link_objects_to_collection(data_to.objects, eca.create_collection(record.display_name))
+                    meshes.extend(obj for obj in data_to.objects if obj.type == 'MESH')
+            
+            armature = eca.get_clone_armature()
+            self.timed(stage, lambda: rig(eca, meshes, armature), meshes=len(meshes))
+        
+        reset_file()
+        load_base_clone()
+        
+        def wire_textures():
+            for record in trait_index.values():
+                if record.folder_name.startswith('DNA') and gender in record.texture_files:
+                    head = eca.get_objects_including('HeadGeo')[0]
+                    eca.apply_dna_textures_to_object(record.texture_files[gender], head)
+        
+        self.timed('textures[dna]', wire_textures)
+    
+    def run(self):
+        try:
+            for _ in range(self.args.repeat):
+                shutil.rmtree(self.extract_dir, ignore_errors=True)
+                self.run_extraction()
+                trait_index = self.run_indexing()
+                self.run_loading(trait_index)
+        finally:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+        
+        for entry in self.results.values():
+            entry['median'] = round(statistics.median(entry['runs']), 6)
+            entry['min'] = round(min(entry['runs']), 6)
+        
+        return self.report()
+    
+    def report(self):
+        fixture = {}
+        manifest_path = os.path.join(self.fixture_dir, 'fixture.json')
+        
+        if os.path.isfile(manifest_path):
+            with open(manifest_path) as f:
+                fixture = json.load(f).get('params', {})
+        
+        return {
+            'meta': {
+                'bpy': 'stand-in' if USING_STANDIN else 'blender ' + '.'.join(str(v) for v in bpy.app.version),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'gender': self.args.gender,
+                'repeat': self.args.repeat,
+                'link': self.args.link,
+            },
+            'fixture': fixture,
+            'stages': self.results,
+        }
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('fixture_dir')
+    parser.add_argument('--output', default='', help='write the JSON report here instead of stdout')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--gender', choices=['male', 'female'], default='male')
+    parser.add_argument('--link', action='store_true', help='link trait libraries instead of appending them')
+    parser.add_argument('--workers', type=lambda s: [int(v) for v in s.split(',')], default=[1, 4], help='comma separated worker counts to extract with')
+    
+    return parser.parse_args(argv)
+
+def main():
+    # Blender passes its own arguments before the '--'
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else sys.argv[1:]
+    args = parse_args(argv)
+    
+    if USING_STANDIN:
+        bpy.configure_fixture(os.path.join(args.fixture_dir, 'fixture.json'))
+    
+    # The add-on's own messages go to stderr, so the report on stdout stays valid JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        report = Benchmark(args).run()
+    
+    text = json.dumps(report, indent=2, sort_keys=True)
+    
+    if args.output != '':
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+if __name__ == '__main__':
+    main()
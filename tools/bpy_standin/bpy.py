@@ -0,0 +1,791 @@
+"""A stand-in for bpy so the benchmark can drive the add-on without Blender
+
+It models only the datablocks and calls the add-on's ingest path uses. Files are
+still read from disk so I/O shows up in the timings, but nothing is decoded, so
+numbers from here are only comparable with other stand-in runs.
+"""
+import os, sys, json, types as _types
+from mathutils import Matrix
+
+__path__ = []
+
+# .blend file name -> list of object descriptions, filled from the fixture manifest
+_fixture_objects = {}
+
+def configure_fixture(manifest_path):
+    with open(manifest_path) as f:
+        _fixture_objects.update(json.load(f)['blend_objects'])
+
+def _read_file(path):
+    # Read the whole file so the stand-in pays the same disk cost as Blender would
+    with open(path, 'rb') as f:
+        while f.read(1024 * 1024):
+            pass
+
+#region DATABLOCKS
+class bpy_struct:
+    pass
+
+class ID(bpy_struct):
+    def __init__(self, name):
+        self.name = name
+        self.users = 0
+        self.use_fake_user = False
+        self.library = None
+        self.override_library = None
+        self.is_missing = False
+        self._props = {}
+    
+    def __getitem__(self, key):
+        return self._props[key]
+    
+    def __setitem__(self, key, value):
+        self._props[key] = value
+    
+    def __delitem__(self, key):
+        del self._props[key]
+    
+    def get(self, key, default=None):
+        return self._props.get(key, default)
+    
+    def copy(self):
+        return type(self)(self.name + '.001')
+    
+    def user_clear(self):
+        self.users = 0
+
+class Modifier(bpy_struct):
+    def __init__(self, name, type):
+        self.name = name
+        self.type = type
+        self.object = None
+
+class _NamedList(list):
+    def __contains__(self, name):
+        return any(item.name == name for item in self)
+    
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            for item in self:
+                if item.name == key:
+                    return item
+            
+            raise KeyError(key)
+        
+        return list.__getitem__(self, key)
+    
+    def get(self, name, default=None):
+        for item in self:
+            if item.name == name:
+                return item
+        
+        return default
+
+class MaterialSlot(bpy_struct):
+    def __init__(self, obj, idx):
+        self._obj = obj
+        self._idx = idx
+    
+    @property
+    def link(self):
+        return self._obj._slot_links.get(self._idx, 'DATA')
+    
+    @link.setter
+    def link(self, value):
+        self._obj._slot_links[self._idx] = value
+    
+    @property
+    def material(self):
+        if self.link == 'OBJECT':
+            return self._obj._object_materials.get(self._idx)
+        
+        return self._obj.data.materials[self._idx]
+    
+    @material.setter
+    def material(self, mat):
+        if self.link == 'OBJECT':
+            self._obj._object_materials[self._idx] = mat
+        elif self._obj.data.library is not None:
+            raise AttributeError('Linked mesh data is not editable')
+        else:
+            self._obj.data.materials[self._idx] = mat
+    
+    @property
+    def name(self):
+        mat = self.material
+        
+        return mat.name if mat is not None else ''
+
+class Mesh(ID):
+    def __init__(self, name, vertex_count=0):
+        super().__init__(name)
+        self.materials = []
+        # Only their lengths are ever looked at
+        self.vertices = range(vertex_count)
+        self.edges = range(vertex_count * 2)
+        self.loops = range(vertex_count * 4)
+        self.polygons = range(vertex_count)
+
+class Armature(ID):
+    pass
+
+class Object(ID):
+    def __init__(self, name, object_data=None, type=None):
+        super().__init__(name)
+        self.data = object_data
+        self.type = type or ('MESH' if isinstance(object_data, Mesh) else 'ARMATURE' if isinstance(object_data, Armature) else 'EMPTY')
+        self.parent = None
+        self.matrix_world = Matrix()
+        self.matrix_parent_inverse = Matrix()
+        self.modifiers = _NamedList()
+        self.users_collection = []
+        self._selected = False
+        self._slot_links = {}
+        self._object_materials = {}
+    
+    @property
+    def material_slots(self):
+        if self.data is None or not hasattr(self.data, 'materials'):
+            return []
+        
+        return [MaterialSlot(self, i) for i in range(len(self.data.materials))]
+    
+    def select_set(self, state):
+        self._selected = state
+    
+    def select_get(self):
+        return self._selected
+    
+    def override_create(self, remap_local_usages=False):
+        # The override shares the linked data, only the object itself becomes local
+        override = data.objects.new(self.name, self.data)
+        
+        if self.data is not None:
+            self.data.users += 1
+        
+        override.override_library = _types.SimpleNamespace(reference=self)
+        override.parent = self.parent
+        override.modifiers = _NamedList(Modifier(m.name, m.type) for m in self.modifiers)
+        
+        for mod, linked_mod in zip(override.modifiers, self.modifiers):
+            mod.object = linked_mod.object
+        
+        if remap_local_usages:
+            for col in list(self.users_collection):
+                col.objects.unlink(self)
+                col.objects.link(override)
+        
+        return override
+
+class Socket(bpy_struct):
+    def __init__(self, node, name):
+        self.node = node
+        self.name = name
+        self.is_linked = False
+        self.default_value = 0.0
+    
+    @property
+    def id_data(self):
+        return self.node.tree
+
+class Node(bpy_struct):
+    def __init__(self, tree, type, name, inputs=(), outputs=('Output',)):
+        self.tree = tree
+        self.type = type
+        self.name = name
+        self.inputs = _NamedList(Socket(self, n) for n in inputs)
+        self.outputs = _NamedList(Socket(self, n) for n in outputs)
+        self.image = None
+        self.node_tree = None
+        self.mute = False
+
+# Input sockets of the Principled BSDF in Blender 3.x, in order
+PRINCIPLED_INPUTS = (
+    'Base Color', 'Subsurface', 'Subsurface Radius', 'Subsurface Color', 'Subsurface IOR', 
+    'Subsurface Anisotropy', 'Metallic', 'Specular', 'Specular Tint', 'Roughness', 'Anisotropic', 
+    'Anisotropic Rotation', 'Sheen', 'Sheen Tint', 'Clearcoat', 'Clearcoat Roughness', 'IOR', 
+    'Transmission', 'Transmission Roughness', 'Emission', 'Emission Strength', 'Alpha', 'Normal', 
+    'Clearcoat Normal', 'Tangent', 'Weight'
+)
+
+class Link(bpy_struct):
+    def __init__(self, from_socket, to_socket):
+        self.from_socket = from_socket
+        self.to_socket = to_socket
+        self.from_node = from_socket.node
+        self.to_node = to_socket.node
+
+class NodeLinks(list):
+    def new(self, a, b):
+        b.is_linked = True
+        a.is_linked = True
+        link = Link(a, b)
+        self.append(link)
+        
+        return link
+    
+    def remove(self, link):
+        list.remove(self, link)
+        link.to_socket.is_linked = any(l.to_socket is link.to_socket for l in self)
+
+class GroupNode(Node):
+    # Group nodes (and a group's own input and output nodes) take their sockets from the group interface
+    def __init__(self, tree, type, name, inputs_from, outputs_from):
+        super().__init__(tree, type, name, (), ())
+        self.inputs_from = inputs_from
+        self.outputs_from = outputs_from
+        self._sockets = {}
+    
+    def _group_sockets(self, in_out):
+        group = self.node_tree if self.type == 'GROUP' else self.tree
+        
+        if group is None or in_out is None:
+            return _NamedList()
+        
+        items = [item for item in group.interface.items_tree if item.in_out == in_out]
+        
+        return _NamedList(self._sockets.setdefault((in_out, item.name), Socket(self, item.name)) for item in items)
+    
+    @property
+    def inputs(self):
+        return self._group_sockets(self.inputs_from)
+    
+    @inputs.setter
+    def inputs(self, value):
+        pass
+    
+    @property
+    def outputs(self):
+        return self._group_sockets(self.outputs_from)
+    
+    @outputs.setter
+    def outputs(self, value):
+        pass
+
+class Nodes(_NamedList):
+    def __init__(self, tree):
+        super().__init__()
+        self.tree = tree
+    
+    def new(self, type):
+        if type == 'ShaderNodeBsdfPrincipled':
+            node = Node(self.tree, 'BSDF_PRINCIPLED', 'Principled BSDF', PRINCIPLED_INPUTS, ('BSDF',))
+        elif type == 'ShaderNodeNormalMap':
+            node = Node(self.tree, 'NORMAL_MAP', 'Normal Map', ('Strength', 'Color'), ('Normal',))
+        elif type == 'ShaderNodeTexImage':
+            node = Node(self.tree, 'TEX_IMAGE', 'Image Texture', ('Vector',), ('Color', 'Alpha'))
+        elif type == 'ShaderNodeOutputMaterial':
+            node = Node(self.tree, 'OUTPUT_MATERIAL', 'Material Output', ('Surface', 'Volume', 'Displacement'), ())
+        elif type == 'ShaderNodeGroup':
+            node = GroupNode(self.tree, 'GROUP', 'Group', 'INPUT', 'OUTPUT')
+        elif type == 'NodeGroupInput':
+            # The group's inputs are the outputs of this node
+            node = GroupNode(self.tree, 'GROUP_INPUT', 'Group Input', None, 'INPUT')
+        elif type == 'NodeGroupOutput':
+            node = GroupNode(self.tree, 'GROUP_OUTPUT', 'Group Output', 'OUTPUT', None)
+        else:
+            node = Node(self.tree, type, type)
+        
+        # Match Blender's unique naming
+        name = node.name
+        i = 1
+        
+        while name in self:
+            name = '{}.{:03d}'.format(node.name, i)
+            i += 1
+        
+        node.name = name
+        node.bl_idname = type
+        self.append(node)
+        
+        return node
+    
+    def remove(self, node):
+        list.remove(self, node)
+        
+        for link in [l for l in self.tree.links if node in (l.from_node, l.to_node)]:
+            self.tree.links.remove(link)
+
+class InterfaceSocket(bpy_struct):
+    def __init__(self, name, in_out, socket_type):
+        self.name = name
+        self.in_out = in_out
+        self.socket_type = socket_type
+        self.default_value = 0.0
+
+class NodeTreeInterface(bpy_struct):
+    def __init__(self):
+        self.items_tree = []
+    
+    def new_socket(self, name, in_out='INPUT', socket_type='NodeSocketFloat'):
+        socket = InterfaceSocket(name, in_out, socket_type)
+        self.items_tree.append(socket)
+        
+        return socket
+
+class NodeTree(ID):
+    def __init__(self, name, type='ShaderNodeTree'):
+        super().__init__(name)
+        self.type = type
+        self.nodes = Nodes(self)
+        self.links = NodeLinks()
+        self.interface = NodeTreeInterface()
+    
+    def copy_from(self, other):
+        # Rebuilds the nodes and links of other in this tree, keeping names and group references
+        for node in other.nodes:
+            copy = self.nodes.new(node.bl_idname)
+            copy.name = node.name
+            copy.node_tree = node.node_tree
+            copy.image = node.image
+        
+        for link in other.links:
+            from_node = self.nodes[link.from_node.name]
+            to_node = self.nodes[link.to_node.name]
+            self.links.new(from_node.outputs[link.from_socket.name], to_node.inputs[link.to_socket.name])
+
+class Material(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.node_tree = None
+        self._use_nodes = False
+    
+    def copy(self):
+        copy = data.materials.new(self.name)
+        copy._use_nodes = self._use_nodes
+        copy.use_fake_user = self.use_fake_user
+        
+        if self.node_tree is not None:
+            copy.node_tree = NodeTree(copy.name)
+            copy.node_tree.copy_from(self.node_tree)
+        
+        return copy
+    
+    @property
+    def use_nodes(self):
+        return self._use_nodes
+    
+    @use_nodes.setter
+    def use_nodes(self, value):
+        if value and self.node_tree is None:
+            self.node_tree = NodeTree(self.name)
+            bsdf = self.node_tree.nodes.new('ShaderNodeBsdfPrincipled')
+            output = self.node_tree.nodes.new('ShaderNodeOutputMaterial')
+            self.node_tree.links.new(bsdf.outputs[0], output.inputs[0])
+        
+        self._use_nodes = value
+
+class ColorspaceSettings(bpy_struct):
+    def __init__(self):
+        self.name = 'sRGB'
+
+class Image(ID):
+    def __init__(self, name, filepath=''):
+        super().__init__(name)
+        self.filepath = filepath
+        self.filepath_raw = filepath
+        self.source = 'FILE' if filepath != '' else 'GENERATED'
+        self.colorspace_settings = ColorspaceSettings()
+        self.size = (0, 0)
+        self.channels = 4
+        self.is_float = False
+        self.packed_file = None
+        self.has_data = False
+
+class Collection(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.objects = _CollectionObjects(self)
+        self.children = _CollectionChildren()
+        self.hide_viewport = False
+        self.hide_render = False
+        self.hide_select = False
+
+class _CollectionObjects(_NamedList):
+    def __init__(self, collection):
+        super().__init__()
+        self.collection = collection
+    
+    def link(self, obj):
+        if obj in self:
+            raise RuntimeError("Object '{}' already in collection '{}'".format(obj.name, self.collection.name))
+        
+        self.append(obj)
+        obj.users_collection.append(self.collection)
+        obj.users += 1
+    
+    def unlink(self, obj):
+        self.remove(obj)
+        obj.users_collection.remove(self.collection)
+        obj.users -= 1
+
+class _CollectionChildren(_NamedList):
+    def link(self, collection):
+        self.append(collection)
+        collection.users += 1
+    
+    def unlink(self, collection):
+        self.remove(collection)
+        collection.users -= 1
+
+class Library(ID):
+    def __init__(self, name, filepath):
+        super().__init__(name)
+        self.filepath = filepath
+#endregion
+
+#region BLEND DATA
+class BlendDataCollection(_NamedList):
+    def __init__(self, factory):
+        super().__init__()
+        self.factory = factory
+    
+    def _unique_name(self, name):
+        unique = name
+        i = 1
+        
+        while unique in self:
+            unique = '{}.{:03d}'.format(name, i)
+            i += 1
+        
+        return unique
+    
+    def new(self, name, *args, **kwargs):
+        block = self.factory(self._unique_name(name), *args, **kwargs)
+        self.append(block)
+        
+        return block
+    
+    def remove(self, block, do_unlink=True, **kwargs):
+        if do_unlink and isinstance(block, Object):
+            for col in list(block.users_collection):
+                col.objects.unlink(block)
+        
+        # Whatever the removed block used loses a user
+        if isinstance(block, Object) and block.data is not None:
+            block.data.users -= 1
+        elif isinstance(block, Mesh):
+            for mat in block.materials:
+                if mat is not None:
+                    mat.users -= 1
+        
+        list.remove(self, block)
+    
+    def keys(self):
+        return [block.name for block in self]
+
+class _ImageCollection(BlendDataCollection):
+    def load(self, filepath, check_existing=False):
+        if check_existing:
+            for image in self:
+                if image.filepath == filepath:
+                    return image
+        
+        _read_file(filepath)
+        image = self.new(os.path.basename(filepath), filepath)
+        image.size = (1, 1)
+        
+        return image
+
+class _LibraryData:
+    def __init__(self):
+        self.objects = []
+        self.meshes = []
+        self.materials = []
+        self.images = []
+        self.node_groups = []
+        self.collections = []
+
+class _LibraryLoad:
+    def __init__(self, data, filepath, link):
+        self.data = data
+        self.filepath = filepath
+        self.link = link
+        self.data_from = _LibraryData()
+        self.data_to = _LibraryData()
+    
+    def __enter__(self):
+        self.descriptions = _fixture_objects.get(os.path.basename(self.filepath), [])
+        self.data_from.objects = [d['name'] for d in self.descriptions]
+        
+        return self.data_from, self.data_to
+    
+    def __exit__(self, *exc):
+        if exc[0] is not None:
+            return False
+        
+        _read_file(self.filepath)
+        library = self.data.libraries.new(os.path.basename(self.filepath), self.filepath) if self.link else None
+        wanted = {name if isinstance(name, str) else name.name for name in self.data_to.objects}
+        by_name = {desc['name']: desc for desc in self.descriptions}
+        
+        # Like Blender, the parents and modifier targets of what was asked for come along too
+        needed = set(wanted)
+        
+        for name in wanted:
+            desc = by_name.get(name, {})
+            needed.update(n for n in [desc.get('parent')] + [m.get('object') for m in desc.get('modifiers', [])] if n in by_name)
+        
+        added = {}
+        
+        for desc in sorted((d for d in self.descriptions if d['name'] in needed), key=lambda d: d['name'] in wanted):
+            added[desc['name']] = self.data.add_described_object(desc, library, added)
+        
+        self.data_to.objects = [added[desc['name']] for desc in self.descriptions if desc['name'] in wanted]
+        
+        return False
+
+class _Libraries(BlendDataCollection):
+    def load(self, filepath, link=False, relative=False):
+        return _LibraryLoad(data, filepath, link)
+    
+    def write(self, filepath, datablocks, **kwargs):
+        with open(filepath, 'wb') as f:
+            f.write(b'BLENDER-v302')
+
+class BlendData:
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        self.objects = BlendDataCollection(Object)
+        self.meshes = BlendDataCollection(Mesh)
+        self.armatures = BlendDataCollection(Armature)
+        self.materials = BlendDataCollection(Material)
+        self.images = _ImageCollection(Image)
+        self.collections = BlendDataCollection(Collection)
+        self.node_groups = BlendDataCollection(NodeTree)
+        self.libraries = _Libraries(Library)
+        self.actions = BlendDataCollection(ID)
+        self.textures = BlendDataCollection(ID)
+        self.lights = BlendDataCollection(ID)
+        self.curves = BlendDataCollection(ID)
+        self.cameras = BlendDataCollection(ID)
+        self.filepath = ''
+    
+    def add_described_object(self, desc, library=None, loaded=None):
+        # Objects in the fixture manifest look like {name, type, parent, material, modifiers}
+        if desc['type'] == 'MESH':
+            object_data = self.meshes.new(desc['name'], desc.get('vertices', 0))
+            
+            for mat_name in desc.get('materials', []):
+                mat = self.materials.get(mat_name) or self.materials.new(mat_name)
+                mat.use_nodes = True
+                mat.users += 1
+                object_data.materials.append(mat)
+        elif desc['type'] == 'ARMATURE':
+            object_data = self.armatures.new(desc['name'])
+        else:
+            object_data = None
+        
+        obj = self.objects.new(desc['name'], object_data)
+        obj.library = library
+        
+        if object_data is not None:
+            object_data.library = library
+            object_data.users += 1
+        
+        if desc.get('parent') is not None:
+            obj.parent = (loaded or {}).get(desc['parent']) or self.objects.get(desc['parent'])
+        
+        for mod in desc.get('modifiers', []):
+            modifier = Modifier(mod['name'], mod['type'])
+            modifier.object = (loaded or {}).get(mod.get('object')) or self.objects.get(mod.get('object'))
+            obj.modifiers.append(modifier)
+        
+        return obj
+    
+    def batch_remove(self, ids):
+        for block in list(ids):
+            for collection in (self.objects, self.meshes, self.armatures, self.materials, self.images, 
+                               self.collections, self.node_groups, self.actions, self.textures, self.lights, 
+                               self.curves, self.cameras, self.libraries):
+                if any(item is block for item in collection):
+                    collection.remove(block)
+                    break
+    
+    def orphans_purge(self, **kwargs):
+        return 0
+
+data = BlendData()
+#endregion
+
+#region CONTEXT
+class _ViewLayerObjects:
+    def __init__(self):
+        self.active = None
+    
+    def _linked(self):
+        return [o for o in data.objects if len(o.users_collection) > 0]
+    
+    def __iter__(self):
+        return iter(self._linked())
+    
+    def __len__(self):
+        return len(self._linked())
+
+class ViewLayer:
+    def __init__(self):
+        self.objects = _ViewLayerObjects()
+        self.active_layer_collection = None
+    
+    def update(self):
+        pass
+
+class Scene(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.collection = Collection('Scene Collection')
+    
+    @property
+    def objects(self):
+        return [o for o in data.objects if len(o.users_collection) > 0]
+
+class WindowManager(ID):
+    def progress_begin(self, start, end):
+        pass
+    
+    def progress_update(self, value):
+        pass
+    
+    def progress_end(self):
+        pass
+
+class _Preferences:
+    def __init__(self):
+        self.addons = {}
+
+class Context:
+    def __init__(self):
+        self.scene = Scene('Scene')
+        self.view_layer = ViewLayer()
+        self.window_manager = WindowManager('WinMan')
+        self.preferences = _Preferences()
+        self.screen = None
+        self.window = None
+    
+    @property
+    def selected_objects(self):
+        return [o for o in data.objects if o.select_get()]
+    
+    @property
+    def active_object(self):
+        return self.view_layer.objects.active
+    
+    def copy(self):
+        return {}
+
+context = Context()
+
+def reset():
+    """Start again from an empty file"""
+    data.reset()
+    context.scene.collection = Collection('Scene Collection')
+    context.view_layer = ViewLayer()
+#endregion
+
+#region MODULES
+def _module(name, **attrs):
+    module = _types.ModuleType('bpy.' + name)
+    module.__dict__.update(attrs)
+    sys.modules['bpy.' + name] = module
+    
+    return module
+
+class _StandinClass:
+    pass
+
+class Operator(_StandinClass):
+    def report(self, level, message):
+        print(message)
+
+class Panel(_StandinClass):
+    pass
+
+class PropertyGroup(_StandinClass):
+    pass
+
+class AddonPreferences(_StandinClass):
+    pass
+
+def _property(**kwargs):
+    # Returning the default lets class attribute lookups like get_scene().clonex_gender work
+    if 'default' in kwargs:
+        return kwargs['default']
+    
+    if 'items' in kwargs and not callable(kwargs['items']):
+        return kwargs['items'][0][0]
+    
+    return None
+
+class _PropertyCollection(list):
+    def add(self):
+        item = _types.SimpleNamespace()
+        self.append(item)
+        
+        return item
+
+def _collection_property(**kwargs):
+    return _PropertyCollection()
+
+def _pointer_property(**kwargs):
+    # Property groups become a namespace with every property unset, ID pointers start out empty
+    group = kwargs.get('type')
+    
+    if PropertyGroup in getattr(group, '__mro__', ()):
+        return _types.SimpleNamespace(**{name: None for name in getattr(group, '__annotations__', {})})
+    
+    return None
+
+types = _module(
+    'types', ID=ID, Object=Object, Mesh=Mesh, Material=Material, Image=Image, Collection=Collection, 
+    Scene=Scene, WindowManager=WindowManager, Operator=Operator, Panel=Panel, PropertyGroup=PropertyGroup, 
+    AddonPreferences=AddonPreferences, NodeTree=NodeTree, ShaderNodeTree=NodeTree, bpy_struct=bpy_struct
+)
+props = _module(
+    'props', StringProperty=_property, BoolProperty=_property, IntProperty=_property, FloatProperty=_property, 
+    EnumProperty=_property, CollectionProperty=_collection_property, PointerProperty=_pointer_property
+)
+
+class _Previews:
+    def close(self):
+        pass
+
+utils = _module(
+    'utils', register_class=lambda cls: None, unregister_class=lambda cls: None, 
+    user_resource=lambda resource_type, path='', create=False: os.path.join(os.path.expanduser('~'), '.easy_clonex_standin', path)
+)
+utils.previews = _module('utils.previews', new=lambda: _Previews(), remove=lambda p: None)
+path = _module('path', abspath=lambda p, **kwargs: os.path.abspath(p))
+
+class _Timers:
+    def __init__(self):
+        self.registered = []
+    
+    def register(self, function, first_interval=0, persistent=False):
+        self.registered.append(function)
+    
+    def unregister(self, function):
+        self.registered.remove(function)
+    
+    def is_registered(self, function):
+        return function in self.registered
+
+app = _module('app', version=(3, 2, 0), background=True, timers=_Timers())
+app.handlers = _module('app.handlers', 
+    load_post=[], save_pre=[], render_pre=[], render_post=[], render_complete=[], render_cancel=[], depsgraph_update_post=[], 
+    persistent=lambda function: function
+)
+
+def _parent_clear(type='CLEAR'):
+    # Mirrors CLEAR_KEEP_TRANSFORM for the selected objects
+    for obj in context.selected_objects:
+        obj.parent = None
+    
+    return {'FINISHED'}
+
+ops = _module('ops', 
+    object=_types.SimpleNamespace(parent_clear=_parent_clear), 
+    view3d=_types.SimpleNamespace(view_selected=lambda: {'FINISHED'})
+)
+#endregion
@@ -0,0 +1,44 @@
+# Just enough of mathutils for the add-on modules to import and for the rigging
+# code to copy matrices around outside of Blender
+
+class Vector(tuple):
+    def __new__(cls, values=(0.0, 0.0, 0.0)):
+        return super().__new__(cls, values)
+
+class Euler(Vector):
+    pass
+
+class Matrix:
+    def __init__(self, rows=None):
+        self.rows = [list(r) for r in rows] if rows is not None else [[float(i == j) for j in range(4)] for i in range(4)]
+    
+    @classmethod
+    def Identity(cls, size=4):
+        return cls()
+    
+    @classmethod
+    def Translation(cls, vector):
+        m = cls()
+        
+        for i, v in enumerate(vector):
+            m.rows[i][3] = v
+        
+        return m
+    
+    @classmethod
+    def Scale(cls, factor, size=4, axis=None):
+        return cls([[float(i == j) * (factor if i < 3 else 1.0) for j in range(4)] for i in range(4)])
+    
+    @classmethod
+    def Rotation(cls, angle, size=4, axis='X'):
+        # Rotation is never inspected outside of Blender
+        return cls()
+    
+    def copy(self):
+        return Matrix(self.rows)
+    
+    def __matmul__(self, other):
+        return Matrix([[sum(self.rows[i][k] * other.rows[k][j] for k in range(4)) for j in range(4)] for i in range(4)])
+    
+    def __eq__(self, other):
+        return isinstance(other, Matrix) and self.rows == other.rows
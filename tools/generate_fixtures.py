@@ -0,0 +1,282 @@
+"""Generate synthetic CloneX download folders for benchmarking the add-on
+
+    python tools/generate_fixtures.py OUT_DIR --clones 2 --traits 30 --textures 5 --resolution 1024 --compression 6
+
+Every clone folder gets a Characters-character zip, a DNA texture zip and the
+requested number of wearable zips laid out like the RTFKT downloads, plus a
+fixture.json describing what is inside each .blend for the stand-in bpy. The
+.blend files hold real object, mesh and image blocks for the add-on's reader.
+"""
+import os, json, zlib, struct, random, zipfile, argparse
+
+CATEGORIES = ['Tops', 'Bottoms', 'Shoes', 'Hair', 'Eyewear', 'Mouth', 'Helmet', 'Jewelry']
+CHANNELS = ['d', 'm', 'r', 'e', 'n']
+
+def png_chunk(tag, payload):
+    return struct.pack('>I', len(payload)) + tag + payload + struct.pack('>I', zlib.crc32(tag + payload))
+
+def make_png(width, height, rng):
+    # Half noise, half flat colour per row, so the PNG compresses roughly like a real texture map
+    noise_bytes = (width * 3) // 2
+    flat = bytes([rng.randrange(256)]) * (width * 3 - noise_bytes)
+    raw = b''.join(b'\0' + rng.randbytes(noise_bytes) + flat for _ in range(height))
+    
+    return (
+        b'\x89PNG\r\n\x1a\n' 
+        + png_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)) 
+        + png_chunk(b'IDAT', zlib.compress(raw, 6)) 
+        + png_chunk(b'IEND', b'')
+    )
+
+# Just enough of the SDNA for the structs the add-on's .blend reader looks at, 
+# as (type, [(field type, field name)])
+BLEND_TYPES = [('char', 1), ('short', 2), ('int', 4), ('void', 0), ('ID', 0), ('Object', 0), ('Mesh', 0), ('Material', 0), ('Image', 0)]
+BLEND_STRUCTS = [
+    ('ID', [('void', '*next'), ('void', '*prev'), ('char', 'name[66]'), ('short', 'flag')]),
+    ('Object', [('ID', 'id'), ('short', 'type'), ('short', 'partype'), ('ID', '*data'), ('Object', '*parent'), ('Material', '**mat'), ('int', 'totcol')]),
+    ('Mesh', [('ID', 'id'), ('Material', '**mat'), ('int', 'totvert'), ('int', 'totpoly'), ('short', 'totcol')]),
+    ('Material', [('ID', 'id')]),
+    ('Image', [('ID', 'id'), ('char', 'filepath[1024]')]),
+]
+BLEND_OBJECT_TYPES = {'EMPTY': 0, 'MESH': 1, 'ARMATURE': 25}
+
+def blend_struct_layout():
+    sizes = dict(BLEND_TYPES)
+    layouts = {}
+    
+    for type_name, fields in BLEND_STRUCTS:
+        offset = 0
+        layout = {}
+        
+        for field_type, field_name in fields:
+            count = 1
+            
+            for dim in field_name[field_name.find('['):].strip('[]').split('][') if '[' in field_name else []:
+                count *= int(dim)
+            
+            size = 8 if field_name.startswith('*') else sizes[field_type] * count
+            layout[field_name.lstrip('*').split('[')[0]] = (offset, field_type)
+            offset += size
+        
+        sizes[type_name] = offset
+        layouts[type_name] = layout
+    
+    return sizes, layouts
+
+def make_sdna(sizes):
+    def pad4(data):
+        return data + b'\0' * (-len(data) % 4)
+    
+    type_names = [t for t, _ in BLEND_TYPES]
+    names = []
+    
+    for _, fields in BLEND_STRUCTS:
+        for _, field_name in fields:
+            if field_name not in names:
+                names.append(field_name)
+    
+    sdna = b'SDNANAME' + struct.pack('<i', len(names)) + pad4(b''.join(n.encode() + b'\0' for n in names))
+    sdna += b'TYPE' + struct.pack('<i', len(type_names)) + pad4(b''.join(t.encode() + b'\0' for t in type_names))
+    sdna += b'TLEN' + pad4(b''.join(struct.pack('<h', sizes[t]) for t in type_names))
+    sdna += b'STRC' + struct.pack('<i', len(BLEND_STRUCTS))
+    
+    for type_name, fields in BLEND_STRUCTS:
+        sdna += struct.pack('<hh', type_names.index(type_name), len(fields))
+        
+        for field_type, field_name in fields:
+            sdna += struct.pack('<hh', type_names.index(field_type), names.index(field_name))
+    
+    return sdna
+
+def make_blend(size, rng, objects, images=()):
+    """A 3.2 style little endian .blend with real OB, ME, MA and IM blocks, padded with filler to size
+    
+    Only the fields the add-on reads are filled in, so Blender itself can't open these
+    """
+    sizes, layouts = blend_struct_layout()
+    struct_index = {type_name: i for i, (type_name, _) in enumerate(BLEND_STRUCTS)}
+    addresses = {}
+    blocks = []
+    
+    def address(key):
+        return addresses.setdefault(key, 0x10000 + 0x100 * len(addresses))
+    
+    def block(code, type_name, key, values):
+        data = bytearray(sizes[type_name])
+        
+        for path, value in values.items():
+            offset = 0
+            field_type = type_name
+            
+            for name in path.split('.'):
+                field_offset, field_type = layouts[field_type][name]
+                offset += field_offset
+            
+            if isinstance(value, str):
+                encoded = value.encode()
+                data[offset:offset + len(encoded)] = encoded
+            elif field_type == 'short':
+                struct.pack_into('<h', data, offset, value)
+            elif field_type == 'int':
+                struct.pack_into('<i', data, offset, value)
+            else:
+                struct.pack_into('<Q', data, offset, value)
+        
+        blocks.append((code, struct_index[type_name], address(key), bytes(data)))
+    
+    for desc in objects:
+        values = {'id.name': 'OB' + desc['name'], 'type': BLEND_OBJECT_TYPES.get(desc['type'], 0)}
+        
+        if desc.get('parent') is not None:
+            values['parent'] = address(('OB', desc['parent']))
+        
+        if desc['type'] == 'MESH':
+            values['data'] = address(('ME', desc['name']))
+            block(b'ME', 'Mesh', ('ME', desc['name']), {'id.name': 'ME' + desc['name'], 'totvert': desc.get('vertices', 0), 'totcol': len(desc.get('materials', []))})
+        
+        block(b'OB', 'Object', ('OB', desc['name']), values)
+    
+    for mat in sorted({m for desc in objects for m in desc.get('materials', [])}):
+        block(b'MA', 'Material', ('MA', mat), {'id.name': 'MA' + mat})
+    
+    for image in images:
+        block(b'IM', 'Image', ('IM', image), {'id.name': 'IM' + os.path.basename(image), 'filepath': image})
+    
+    def bhead(code, sdna_index, old_address, data):
+        return struct.pack('<4siQii', code, len(data), old_address, sdna_index, 1) + data
+    
+    body = b''.join(bhead(*b) for b in blocks)
+    dna = bhead(b'DNA1', 0, 0, make_sdna(sizes))
+    header = b'BLENDER-v302'
+    end = struct.pack('<4siQii', b'ENDB', 0, 0, 0, 0)
+    
+    # The filler stands in for the mesh and pixel data, half noise so it compresses like the real thing
+    filler = max(0, size - len(header) - len(body) - len(dna) - len(end) - 24)
+    filler_data = rng.randbytes(filler // 2) + b'\0' * (filler - filler // 2)
+    
+    return header + body + bhead(b'DATA', 0, 0, filler_data) + dna + end
+
+def rig_name(gender):
+    return 'Genesis8_1' + gender.capitalize()
+
+def trait_objects(stem, gender, meshes):
+    # Every trait file ships its own copy of the rig, which the add-on throws away
+    rig = rig_name(gender)
+    objects = [{'name': rig, 'type': 'ARMATURE'}]
+    
+    for i in range(meshes):
+        objects.append({
+            'name': '{}_{}_Geo{}'.format(stem, gender, i),
+            'type': 'MESH',
+            'parent': rig,
+            'materials': ['{}_Mat{}'.format(stem, i)],
+            'modifiers': [{'name': rig, 'type': 'ARMATURE', 'object': rig}],
+            'vertices': 2000 + 1000 * i,
+        })
+    
+    return objects
+
+def base_objects(gender):
+    rig = rig_name(gender)
+    objects = [{'name': rig, 'type': 'ARMATURE'}]
+    
+    for name, mat in (('HeadGeo', 'Head'), ('SuitGeo', 'Suit'), ('EyesGeo', 'Eyes')):
+        objects.append({
+            'name': name,
+            'type': 'MESH',
+            'parent': rig,
+            'materials': [mat],
+            'modifiers': [{'name': 'Armature', 'type': 'ARMATURE', 'object': rig}],
+            'vertices': 20000,
+        })
+    
+    return objects
+
+def write_zip(path, members, compression):
+    method = zipfile.ZIP_STORED if compression == 0 else zipfile.ZIP_DEFLATED
+    
+    with zipfile.ZipFile(path, 'w', method, compresslevel=compression if compression > 0 else None) as zip_ref:
+        for name, payload in members:
+            zip_ref.writestr(name, payload)
+
+def generate_clone(out_dir, clone_id, args, rng):
+    os.makedirs(out_dir, exist_ok=True)
+    blend_objects = {}
+    
+    def texture_names(prefix, folder, count):
+        return ['{}/{}_{}.png'.format(folder, prefix, CHANNELS[i] if i < len(CHANNELS) else 'extra{}'.format(i)) for i in range(count)]
+    
+    def texture_set(prefix, folder, count):
+        return [(name, make_png(args.resolution, args.resolution, rng)) for name in texture_names(prefix, folder, count)]
+    
+    # Base clone with the suit textures
+    stem = 'Characters-character_{}'.format(clone_id)
+    members = []
+    
+    for gender in ('male', 'female'):
+        blend_name = '{}_{}.blend'.format(stem, gender)
+        blend_objects[blend_name] = base_objects(gender)
+        
+        # The base clone references its suit textures relative to the .blend
+        images = ['//../../' + name for name in texture_names('Suit', '_textures/suit_' + gender, args.textures)]
+        members.append(('_{}/_blender/{}'.format(gender, blend_name), make_blend(args.blend_kb * 1024, rng, blend_objects[blend_name], images)))
+        members.append(('_{}/_fbx/{}.fbx'.format(gender, stem), rng.randbytes(args.blend_kb * 256)))
+        members += texture_set('Suit', '_textures/suit_' + gender, args.textures)
+    
+    write_zip(os.path.join(out_dir, stem + '.zip'), members, args.compression)
+    
+    # DNA head textures
+    write_zip(
+        os.path.join(out_dir, 'DNA-human_{}-Combined.zip'.format(clone_id)), 
+        texture_set('Head', '_texture', args.textures), 
+        args.compression
+    )
+    
+    # Wearables
+    for i in range(args.traits):
+        stem = '{}-trait_{}_{}-Combined'.format(CATEGORIES[i % len(CATEGORIES)], clone_id, i)
+        members = []
+        
+        for gender in ('male', 'female'):
+            blend_name = '{}_{}.blend'.format(stem, gender)
+            blend_objects[blend_name] = trait_objects(stem, gender, args.meshes)
+            
+            images = ['//../_textures/{}_{}.png'.format(stem, c) for c in CHANNELS[:3]]
+            members.append(('_{}/_blender/{}'.format(gender, blend_name), make_blend(args.blend_kb * 1024, rng, blend_objects[blend_name], images)))
+            members.append(('_{}/_fbx/{}.fbx'.format(gender, stem), rng.randbytes(args.blend_kb * 256)))
+        
+        write_zip(os.path.join(out_dir, stem + '.zip'), members, args.compression)
+    
+    manifest = {
+        'params': {k: v for k, v in vars(args).items() if k != 'out_dir'},
+        'blend_objects': blend_objects,
+    }
+    
+    with open(os.path.join(out_dir, 'fixture.json'), 'w') as f:
+        json.dump(manifest, f, indent=1)
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('out_dir')
+    parser.add_argument('--clones', type=int, default=1)
+    parser.add_argument('--traits', type=int, default=20, help='wearable zips per clone')
+    parser.add_argument('--meshes', type=int, default=2, help='mesh objects per wearable .blend')
+    parser.add_argument('--textures', type=int, default=5, help='images per texture set, past 5 they get non-channel names')
+    parser.add_argument('--resolution', type=int, default=1024, help='texture width and height in pixels')
+    parser.add_argument('--compression', type=int, default=6, choices=range(0, 10), help='zip deflate level, 0 stores')
+    parser.add_argument('--blend-kb', type=int, default=512, help='size of every generated .blend file')
+    parser.add_argument('--seed', type=int, default=0)
+    
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    rng = random.Random(args.seed)
+    
+    for clone_id in range(args.clones):
+        out_dir = os.path.join(args.out_dir, 'clone_{}'.format(clone_id))
+        generate_clone(out_dir, clone_id, args, rng)
+        print('Wrote ' + out_dir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""Write a JSON inventory of CloneX downloads without starting Blender
+
+    python tools/inventory.py CLONEX_DIR [CLONEX_DIR ...] --output-dir inventories --jobs 8
+
+Every CLONEX_DIR is either one clone folder (holding the Characters-character
+and *-Combined zips or folders) or a folder of clone folders. One JSON file per
+clone lists every trait, which genders it has, the objects, meshes (with vertex
+counts), materials and images inside its .blend files and its texture files.
+Zipped traits are read in place, nothing is extracted and no sidecar files are
+written, so read only shares can be audited. Clones are spread across processes.
+"""
+import os, sys, json, time, hashlib, argparse
+from concurrent.futures import ProcessPoolExecutor
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(TOOLS_DIR)
+
+# clonex_io doesn't need bpy, so it can be imported straight from the add-on folder
+sys.path.insert(0, ADDON_DIR)
+
+from clonex_io import index, blendfile
+
+def is_clone_folder(path):
+    with os.scandir(path) as entries:
+        return any(index.is_base_clone(e.name) or index.is_trait_folder(os.path.splitext(e.name)[0]) for e in entries)
+
+def find_clone_folders(paths):
+    clones = []
+    
+    for path in paths:
+        path = os.path.abspath(path)
+        
+        if is_clone_folder(path):
+            clones.append(path)
+            continue
+        
+        with os.scandir(path) as entries:
+            clones.extend(sorted(e.path for e in entries if e.is_dir() and is_clone_folder(e.path)))
+    
+    return clones
+
+def open_blend(record, path):
+    if record.archive == '':
+        return blendfile.BlendFile(path)
+    
+    # Zipped records point into the archive itself, see inventory_clone
+    return blendfile.open_zip_member(record.archive, os.path.relpath(path, record.trait_dir).replace(os.sep, '/'))
+
+def inventory_trait(record):
+    blend_files = {}
+    
+    for gender, path in sorted(record.blend_files.items()):
+        entry = {'file': os.path.relpath(path, record.trait_dir).replace(os.sep, '/')}
+        
+        try:
+            with open_blend(record, path) as blend:
+                entry.update(blendfile.read_contents(blend))
+        except (OSError, KeyError, blendfile.BlendFileError) as e:
+            entry['error'] = str(e)
+        
+        blend_files[gender] = entry
+    
+    return {
+        'folder_name': record.folder_name,
+        'display_name': record.display_name,
+        'source': 'zip' if record.archive != '' else 'folder',
+        'genders': list(record.genders),
+        'blend_files': blend_files,
+        'textures': {
+            gender: [[os.path.relpath(p, record.trait_dir).replace(os.sep, '/'), channel] for p, channel in files]
+            for gender, files in sorted(record.texture_files.items())
+        },
+    }
+
+def inventory_clone(directory):
+    start = time.perf_counter()
+    
+    # Pointing zipped traits at the zip itself keeps their member paths recoverable
+    trait_index = index.build_trait_index(directory, lambda folder_name, archive: archive, use_cache=False)
+    base_clone = index.find_base_clone(trait_index)
+    traits = [inventory_trait(record) for record in trait_index.values()]
+    totals = {}
+    
+    for gender in index.GENDERS:
+        blends = [t['blend_files'][gender] for t in traits if gender in t['blend_files']]
+        totals[gender] = {
+            'traits': sum(1 for t in traits if gender in t['genders']),
+            'meshes': sum(len(b.get('meshes', [])) for b in blends),
+            'vertices': sum(m['vertices'] or 0 for b in blends for m in b.get('meshes', [])),
+            'unreadable_blend_files': sum(1 for b in blends if 'error' in b),
+        }
+    
+    return {
+        'clone': os.path.basename(directory),
+        'directory': directory,
+        'base_clone': base_clone.folder_name if base_clone is not None else None,
+        'totals': totals,
+        'traits': traits,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+def output_name(directory, used):
+    name = os.path.basename(directory)
+    
+    # Clone folders in different parents can share a name
+    if name in used:
+        name += '-' + hashlib.sha1(directory.encode()).hexdigest()[:8]
+    
+    used.add(name)
+    
+    return name + '.json'
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', metavar='CLONEX_DIR')
+    parser.add_argument('--output-dir', default='.', help='where the per clone JSON files are written')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='clones read in parallel')
+    
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    clones = find_clone_folders(args.paths)
+    os.makedirs(args.output_dir, exist_ok=True)
+    used = set()
+    failed = 0
+    
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(clones) or 1))) as pool:
+        futures = [(directory, pool.submit(inventory_clone, directory)) for directory in clones]
+        
+        for directory, future in futures:
+            try:
+                inventory = future.result()
+            except Exception as e:
+                print('Failed to read {}: {}'.format(directory, e), file=sys.stderr)
+                failed += 1
+                continue
+            
+            path = os.path.join(args.output_dir, output_name(directory, used))
+            
+            with open(path, 'w') as f:
+                json.dump(inventory, f, indent=1)
+            
+            print('Wrote {} ({} traits)'.format(path, len(inventory['traits'])))
+    
+    return 1 if failed > 0 else 0
+
+if __name__ == '__main__':
+    sys.exit(main())